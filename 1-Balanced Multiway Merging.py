@@ -2,9 +2,73 @@
 # - heapq: Para usar estructuras de datos de tipo "min-heap" (cola de prioridad).
 # - os: Para operaciones con archivos (ej. eliminar archivos temporales).
 # - random: Para generar números aleatorios.
+# - array: Para empaquetar enteros de ancho fijo en los runs binarios.
+# - sys: Para medir el tamaño real en memoria de los chunks (sys.getsizeof).
+# - contextmanager: Para la versión en streaming que limpia sus archivos temporales.
+# - time: Para medir el benchmark de creación de runs.
+# - numpy (opcional): Para parsear y ordenar cada chunk en bloque.
 import heapq
 import os
 import random
+import sys
+import time
+from array import array
+from contextlib import contextmanager
+
+try:
+    import numpy as np
+except ImportError:  # Sin numpy los chunks se leen línea a línea y se ordenan con sorted()
+    np = None
+
+# --- CONFIGURACIÓN DEL FORMATO DE LOS RUNS ---
+# Los runs temporales pueden escribirse como texto decimal ('text') o como enteros
+# empaquetados de ancho fijo ('binary'). El formato binario evita formatear y parsear
+# cada número en texto: se escribe y se lee en bloques grandes con el módulo array.
+RUN_FORMATS = ('text', 'binary')
+RUN_TYPECODE = 'q'  # Entero con signo de 8 bytes (int64)
+RUN_RECORD_SIZE = array(RUN_TYPECODE).itemsize  # Bytes que ocupa cada registro
+RUN_BLOCK_RECORDS = 65_536  # Registros leídos por cada acceso a disco en modo binario
+
+# --- CONFIGURACIÓN DE LOS BUFFERS DE LA MEZCLA ---
+# La memoria total de la mezcla se reparte entre un buffer de lectura por run y un
+# buffer para la salida, de modo que cada acceso a disco mueve un bloque grande.
+MERGE_MEMORY_BUDGET = 64 * 1024 * 1024  # 64 MB por defecto para toda la mezcla
+MIN_BUFFER_BYTES = 4096  # Ningún buffer baja de una página de disco
+MAX_FAN_IN = 512  # Máximo de runs abiertos a la vez (por debajo del límite de descriptores)
+
+# --- CONFIGURACIÓN DE LOS RUNS RLE ---
+# Con muchas claves repetidas cada run guarda pares (valor, repeticiones) como dos
+# int64 seguidos, así el tamaño del run depende de las claves distintas, no del total.
+RLE_PAIR_SIZE = 2 * RUN_RECORD_SIZE  # Bytes de cada par (valor, repeticiones)
+RLE_OUTPUTS = ('sorted', 'distinct', 'count_by')  # Salidas que produce la mezcla RLE
+
+# --- CONFIGURACIÓN DEL ORDENAMIENTO POR CONTEO ---
+# Cada valor posible del dominio ocupa una casilla del histograma, un int64 de un
+# array('q') (8 bytes exactos; en una lista cada conteo > 256 sería además un objeto
+# int de 28 bytes); si el dominio no cabe en el presupuesto se vuelve a los runs.
+COUNT_SLOT_BYTES = array(RUN_TYPECODE).itemsize
+
+# --- CONFIGURACIÓN DE LA CREACIÓN DE RUNS CON NUMPY ---
+# Con memory_limit, el bloque leído mide memory_limit // NUMPY_BLOCK_DIVISOR bytes.
+# Pico medido por byte de bloque: 1 (bloque) + 5 (np.fromstring reserva de más
+# mientras parsea líneas de 2 bytes, que acaban en 4 bytes de int64) + 2 (búfer
+# del ordenamiento estable), con margen para la escritura del run.
+NUMPY_BLOCK_DIVISOR = 10
+
+# --- FUNCIÓN 0: Calcular el tamaño de los buffers de la mezcla ---
+def merge_buffer_size(memory_budget, fan_in):
+    """
+    Reparte el presupuesto de memoria de la mezcla entre los fan_in runs de entrada
+    y el buffer de salida (fan_in + 1 partes iguales).
+    
+    Args:
+        memory_budget (int): Bytes disponibles para todos los buffers de la mezcla.
+        fan_in (int): Número de runs que se mezclan a la vez.
+    
+    Returns:
+        int: Bytes asignados a cada buffer (nunca menos de MIN_BUFFER_BYTES).
+    """
+    return max(MIN_BUFFER_BYTES, memory_budget // (fan_in + 1))
 
 # --- FUNCIÓN 1: Generar un archivo con datos aleatorios ---
 def generate_large_file(filename, size=1_000_000, max_num=10_000):
@@ -36,18 +100,219 @@ def sort_chunk(chunk):
     """
     return sorted(chunk)  # Retorna la lista ordenada
 
-# --- FUNCIÓN 3: Dividir el archivo en runs ordenados ---
-def split_into_sorted_runs(filename, chunk_size=100_000):
+# --- FUNCIÓN 3: Escribir un run en disco ---
+def write_run(temp_file, chunk_sorted, run_format='text'):
+    """
+    Escribe un run ordenado en un archivo temporal con el formato indicado.
+    
+    Args:
+        temp_file (str): Ruta del archivo temporal.
+        chunk_sorted (list): Números ya ordenados.
+        run_format (str): 'text' (un número decimal por línea) o 'binary' (int64 empaquetados).
+    """
+    if run_format == 'binary':
+        # Empaqueta todos los números en un array de int64 y lo vuelca en una sola escritura
+        with open(temp_file, 'wb') as tf:
+            array(RUN_TYPECODE, chunk_sorted).tofile(tf)
+    else:
+        with open(temp_file, 'w') as tf:
+            # Convierte los números a strings y los une con saltos de línea
+            tf.write('\n'.join(map(str, chunk_sorted)))
+
+# --- FUNCIÓN 4: Leer un run desde disco ---
+def read_run(handle, run_format='text', buffer_bytes=None):
+    """
+    Generador que devuelve, uno a uno, los números de un run abierto.
+    
+    El run se lee en bloques de buffer_bytes: cada recarga del buffer es una sola
+    llamada de E/S, en lugar de una llamada por número.
+    
+    Args:
+        handle (file): Archivo del run ya abierto ('r' para texto, 'rb' para binario).
+        run_format (str): 'text' o 'binary'.
+        buffer_bytes (int): Tamaño del buffer de lectura
+                            (por defecto RUN_BLOCK_RECORDS registros binarios).
+    
+    Yields:
+        int: Siguiente número del run.
+    """
+    if buffer_bytes is None:
+        buffer_bytes = RUN_BLOCK_RECORDS * RUN_RECORD_SIZE
+    
+    if run_format == 'binary':
+        # El bloque debe contener un número entero de registros
+        block_bytes = max(RUN_RECORD_SIZE, buffer_bytes - buffer_bytes % RUN_RECORD_SIZE)
+        while True:
+            # Lee un bloque grande de bytes y lo desempaqueta de una sola vez
+            data = handle.read(block_bytes)
+            if not data:
+                break
+            block = array(RUN_TYPECODE)
+            block.frombytes(data)
+            yield from block
+    else:
+        while True:
+            # readlines(hint) lee líneas completas hasta sumar unos buffer_bytes
+            lines = handle.readlines(buffer_bytes)
+            if not lines:
+                break
+            yield from map(int, lines)
+
+# --- FUNCIÓN 5: Añadir un bloque al final de un run abierto ---
+def append_run_block(tf, block, run_format='text'):
+    """
+    Escribe un bloque de números al final de un run que se está construyendo poco a poco.
+    
+    Args:
+        tf (file): Archivo del run abierto ('w' para texto, 'wb' para binario).
+        block (list): Números a añadir (ya en orden).
+        run_format (str): 'text' o 'binary'.
+    """
+    if run_format == 'binary':
+        array(RUN_TYPECODE, block).tofile(tf)
+    else:
+        tf.write(''.join(f"{num}\n" for num in block))
+
+# --- FUNCIÓN 6: Selección por reemplazo (replacement selection) ---
+def split_into_replacement_runs(filename, heap_size=100_000, run_format='text', memory_limit=None):
+    """
+    Genera los runs con selección por reemplazo usando un min-heap de heap_size números.
+    
+    Cada número que sale del heap se escribe en el run actual y se sustituye por el
+    siguiente de la entrada. Si el nuevo es menor que el que acaba de salir, se marca
+    para el run siguiente. En datos aleatorios los runs miden en promedio 2 * heap_size,
+    y en datos parcialmente ordenados mucho más, por lo que salen menos runs que con
+    split_into_sorted_runs y la mezcla posterior tiene menos fan-in.
+    
+    Args:
+        filename (str): Nombre del archivo grande a procesar.
+        heap_size (int): Números que caben en memoria (por defecto 100,000).
+        run_format (str): Formato de los runs temporales: 'text' o 'binary'.
+        memory_limit (int): Si se indica, el heap se llena hasta ocupar estos bytes
+                            en memoria (sys.getsizeof) y heap_size se ignora.
+    
+    Returns:
+        tuple: (temp_files, stats) con la lista de archivos temporales y un diccionario
+               con 'runs', 'records' y 'avg_length'.
+    """
+    if run_format not in RUN_FORMATS:
+        raise ValueError(f"run_format debe ser uno de {RUN_FORMATS}, no {run_format!r}")
+    
+    extension = 'bin' if run_format == 'binary' else 'txt'
+    mode = 'wb' if run_format == 'binary' else 'w'
+    temp_files = []
+    records = 0
+    
+    with open(filename, 'r') as f:
+        # Llena el heap con los primeros heap_size números (o hasta agotar
+        # memory_limit), todos del run 0
+        heap = []
+        items_bytes = 0
+        for line in f:
+            num = int(line)
+            entry = (0, num)
+            heap.append(entry)
+            if memory_limit is None:
+                if len(heap) == heap_size:
+                    break
+            else:
+                items_bytes += sys.getsizeof(entry) + sys.getsizeof(num)
+                if sys.getsizeof(heap) + items_bytes >= memory_limit:
+                    break
+        heapq.heapify(heap)
+        
+        current_run = -1  # Run que se está escribiendo
+        tf = None  # Archivo abierto del run actual
+        block = []  # Números pendientes de escribir (se vuelcan por bloques)
+        
+        try:
+            while heap:
+                # Lee el siguiente número de la entrada (None si se terminó)
+                line = f.readline()
+                run_id, smallest = heap[0]
+                
+                # Si el mínimo pertenece a un run nuevo, cierra el actual y abre otro
+                if run_id != current_run:
+                    if tf:
+                        append_run_block(tf, block, run_format)
+                        tf.close()
+                    block = []
+                    current_run = run_id
+                    temp_file = f'temp_run_{run_id}.{extension}'
+                    temp_files.append(temp_file)
+                    tf = open(temp_file, mode)
+                
+                block.append(smallest)
+                records += 1
+                if len(block) == RUN_BLOCK_RECORDS:
+                    append_run_block(tf, block, run_format)
+                    block = []
+                
+                if line:
+                    num = int(line)
+                    # Si el número rompería el orden del run actual, va al siguiente run
+                    next_run = run_id if num >= smallest else run_id + 1
+                    heapq.heapreplace(heap, (next_run, num))
+                else:
+                    # Sin más entrada, el heap solo se vacía
+                    heapq.heappop(heap)
+            
+            if tf:
+                append_run_block(tf, block, run_format)
+        finally:
+            if tf:
+                tf.close()
+    
+    stats = {
+        'runs': len(temp_files),
+        'records': records,
+        'avg_length': records / len(temp_files) if temp_files else 0,
+    }
+    return temp_files, stats
+
+# --- FUNCIÓN 7: Dividir el archivo en runs ordenados ---
+def split_into_sorted_runs(filename, chunk_size=100_000, run_format='text', method='chunks',
+                           memory_limit=None, use_numpy=None):
     """
     Divide un archivo grande en chunks más pequeños, los ordena y guarda en archivos temporales.
     
+    El archivo de entrada siempre es texto (un número por línea); run_format solo
+    decide cómo se guardan los runs intermedios.
+    
     Args:
         filename (str): Nombre del archivo grande a procesar.
         chunk_size (int): Tamaño de cada chunk (por defecto 100,000 líneas).
+        run_format (str): Formato de los runs temporales: 'text' o 'binary'.
+        method (str): 'chunks' (runs de chunk_size números) o 'replacement'
+                      (selección por reemplazo con un heap de chunk_size números).
+        memory_limit (int): Si se indica, cada chunk se corta cuando su tamaño real en
+                            memoria (la lista más sus enteros, medido con sys.getsizeof)
+                            alcanza estos bytes, y chunk_size se ignora. Pasa el mismo
+                            valor como memory_budget a multiway_merge para acotar también
+                            la mezcla.
+        use_numpy (bool): Con method='chunks', usa split_into_sorted_runs_numpy (parseo
+                          y ordenamiento vectorizados). Por defecto, si numpy está instalado.
     
     Returns:
         list: Lista con los nombres de los archivos temporales generados.
     """
+    if run_format not in RUN_FORMATS:
+        raise ValueError(f"run_format debe ser uno de {RUN_FORMATS}, no {run_format!r}")
+    
+    if method == 'replacement':
+        temp_files, stats = split_into_replacement_runs(filename, chunk_size, run_format,
+                                                        memory_limit)
+        print(f"📊 Selección por reemplazo: {stats['runs']} runs, "
+              f"longitud media {stats['avg_length']:.0f} números")
+        return temp_files
+    elif method != 'chunks':
+        raise ValueError(f"method debe ser 'chunks' o 'replacement', no {method!r}")
+    
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return split_into_sorted_runs_numpy(filename, chunk_size, run_format, memory_limit)
+    
     temp_files = []  # Almacena los nombres de los archivos temporales
     
     # Abre el archivo grande en modo lectura ('r')
@@ -57,13 +322,23 @@ def split_into_sorted_runs(filename, chunk_size=100_000):
         # Bucle infinito hasta que se procese todo el archivo
         while True:
             chunk = []  # Lista para almacenar los números del chunk actual
+            items_bytes = 0  # Bytes que ocupan los enteros del chunk (modo memory_limit)
             
-            # Lee 'chunk_size' líneas del archivo
-            for _ in range(chunk_size):
+            # Lee 'chunk_size' líneas del archivo (o hasta llenar memory_limit)
+            while True:
                 line = f.readline()  # Lee una línea
                 if not line:  # Si no hay más líneas, termina el bucle
                     break
-                chunk.append(int(line))  # Convierte la línea a entero y la añade al chunk
+                num = int(line)  # Convierte la línea a entero
+                chunk.append(num)  # y lo añade al chunk
+                
+                if memory_limit is None:
+                    if len(chunk) == chunk_size:
+                        break
+                else:
+                    items_bytes += sys.getsizeof(num)
+                    if sys.getsizeof(chunk) + items_bytes >= memory_limit:
+                        break
             
             # Si el chunk está vacío, termina el proceso
             if not chunk:
@@ -72,13 +347,12 @@ def split_into_sorted_runs(filename, chunk_size=100_000):
             # Ordena el chunk en memoria
             chunk_sorted = sort_chunk(chunk)
             
-            # Crea un nombre para el archivo temporal (ej. 'temp_run_0.txt')
-            temp_file = f'temp_run_{i}.txt'
+            # Crea un nombre para el archivo temporal (ej. 'temp_run_0.txt' o 'temp_run_0.bin')
+            extension = 'bin' if run_format == 'binary' else 'txt'
+            temp_file = f'temp_run_{i}.{extension}'
             
             # Escribe el chunk ordenado en el archivo temporal
-            with open(temp_file, 'w') as tf:
-                # Convierte los números a strings y los une con saltos de línea
-                tf.write('\n'.join(map(str, chunk_sorted)))
+            write_run(temp_file, chunk_sorted, run_format)
             
             # Añade el nombre del archivo temporal a la lista
             temp_files.append(temp_file)
@@ -86,70 +360,859 @@ def split_into_sorted_runs(filename, chunk_size=100_000):
     
     return temp_files  # Retorna la lista de archivos temporales
 
-# --- FUNCIÓN 4: Mezcla multiway de los runs ordenados ---
-def multiway_merge(temp_files, output_file='sorted_output.txt'):
+# --- FUNCIÓN 8: Motor de mezcla con min-heap ---
+def heap_merge(readers):
     """
-    Mezcla los archivos temporales (runs ordenados) en un único archivo ordenado usando un min-heap.
+    Mezcla k runs ordenados con un min-heap de tuplas (número, índice_run):
+    un heappop y un heappush por cada número de salida.
     
     Args:
-        temp_files (list): Lista de nombres de archivos temporales.
-        output_file (str): Nombre del archivo de salida ordenado (por defecto 'sorted_output.txt').
+        readers (list): Iteradores de los runs (cada uno ordenado).
+    
+    Yields:
+        int: Los números de todos los runs, en orden.
+    """
+    heap = []  # Estructura de min-heap para mezcla eficiente
+    
+    # Inicializa el heap con el primer elemento de cada run
+    for i, reader in enumerate(readers):
+        num = next(reader, None)  # Lee el primer número del run
+        if num is not None:  # Si el run no está vacío
+            # Añade una tupla (número, índice_archivo) al heap
+            heapq.heappush(heap, (num, i))
+    
+    # Mientras el heap no esté vacío
+    while heap:
+        # Extrae el número más pequeño del heap
+        num, i = heapq.heappop(heap)
+        yield num
+        
+        # Lee el siguiente número del run que contenía el número extraído
+        next_num = next(readers[i], None)
+        if next_num is not None:  # Si hay más números en el run
+            # Añade el nuevo número al heap
+            heapq.heappush(heap, (next_num, i))
+
+# --- FUNCIÓN 9: Motor de mezcla con árbol de perdedores ---
+def loser_tree_merge(readers):
+    """
+    Mezcla k runs ordenados con un árbol de perdedores (tournament tree).
+    
+    Cada nodo interno recuerda el run que perdió su partido y el ganador sale por
+    la raíz. Tras emitir el ganador solo se cambia su hoja y se rejuega su camino
+    hasta la raíz: log2(k) comparaciones por número, sin crear tuplas. Un run
+    agotado juega con +inf, y a igual valor gana el run de menor índice.
+    
+    Args:
+        readers (list): Iteradores de los runs (cada uno ordenado).
+    
+    Yields:
+        int: Los números de todos los runs, en orden.
+    """
+    k = len(readers)
+    if k == 0:
+        return
+    inf = float('inf')
+    keys = [next(reader, inf) for reader in readers]  # Número actual de cada hoja
+    
+    # Las hojas ocupan las posiciones k..2k-1; el nodo p tiene hijos 2p y 2p+1
+    losers = [0] * k
+    winners = [0] * k + list(range(k))
+    for node in range(k - 1, 0, -1):
+        a, b = winners[2 * node], winners[2 * node + 1]
+        if keys[b] < keys[a] or (keys[b] == keys[a] and b < a):
+            a, b = b, a
+        winners[node], losers[node] = a, b
+    winner = winners[1] if k > 1 else 0
+    
+    while keys[winner] != inf:
+        yield keys[winner]
+        # Reemplaza la hoja del ganador y rejuega su camino hasta la raíz
+        keys[winner] = next(readers[winner], inf)
+        value = keys[winner]
+        node = (winner + k) >> 1
+        while node:
+            other = losers[node]
+            other_value = keys[other]
+            if other_value < value or (other_value == value and other < winner):
+                losers[node] = winner
+                winner, value = other, other_value
+            node >>= 1
+
+MERGE_ENGINES = {'heap': heap_merge, 'loser_tree': loser_tree_merge}
+
+# --- FUNCIÓN 10: Una pasada de mezcla multiway ---
+def merge_pass(input_files, output_file, run_format='text', memory_budget=MERGE_MEMORY_BUDGET,
+               output_is_run=False, engine='heap'):
+    """
+    Mezcla varios runs ordenados en un único archivo usando un min-heap
+    (o un árbol de perdedores con engine='loser_tree').
+    
+    Args:
+        input_files (list): Runs a mezclar (todos con el formato run_format).
+        output_file (str): Archivo donde se escribe el resultado.
+        run_format (str): Formato de los runs de entrada: 'text' o 'binary'.
+        memory_budget (int): Bytes totales para los buffers de esta pasada.
+        output_is_run (bool): Si es True la salida es un run intermedio (se escribe
+                              en run_format); si es False es la salida final en texto.
+        engine (str): Motor de mezcla: 'heap' o 'loser_tree'.
     """
     handles = []  # Almacena los descriptores de archivo (file handles)
     
     # Abre cada archivo temporal en modo lectura y guarda su descriptor
-    for file in temp_files:
-        handles.append(open(file, 'r'))
+    mode = 'rb' if run_format == 'binary' else 'r'
+    for file in input_files:
+        handles.append(open(file, mode))
     
-    heap = []  # Estructura de min-heap para mezcla eficiente
+    # Un lector (generador) por run, cada uno con su parte del presupuesto de memoria
+    buffer_bytes = merge_buffer_size(memory_budget, len(input_files))
+    readers = [read_run(handle, run_format, buffer_bytes) for handle in handles]
     
-    # Inicializa el heap con el primer elemento de cada archivo temporal
-    for i, handle in enumerate(handles):
-        line = handle.readline()  # Lee la primera línea del archivo
-        if line:  # Si la línea no está vacía
-            # Añade una tupla (número, índice_archivo) al heap
-            heapq.heappush(heap, (int(line), i))
+    # El buffer de salida acumula números y se vuelca con una sola escritura
+    out_records = max(1, buffer_bytes // RUN_RECORD_SIZE)
+    out_block = []
+    out_format = run_format if output_is_run else 'text'
+    out_mode = 'wb' if out_format == 'binary' else 'w'
     
     # Abre el archivo de salida en modo escritura
-    with open(output_file, 'w') as out:
-        # Mientras el heap no esté vacío
-        while heap:
-            # Extrae el número más pequeño del heap
-            num, i = heapq.heappop(heap)
-            # Escribe el número en el archivo de salida, seguido de un salto de línea
-            out.write(f"{num}\n")
-            
-            # Lee el siguiente número del archivo que contenía el número extraído
-            next_line = handles[i].readline()
-            if next_line:  # Si hay más números en el archivo
-                # Añade el nuevo número al heap
-                heapq.heappush(heap, (int(next_line), i))
+    with open(output_file, out_mode) as out:
+        # El motor entrega los números en orden
+        for num in MERGE_ENGINES[engine](readers):
+            # Guarda el número en el buffer de salida y lo vuelca cuando está lleno
+            out_block.append(num)
+            if len(out_block) == out_records:
+                append_run_block(out, out_block, out_format)
+                out_block = []
+        
+        # Vuelca lo que quede en el buffer de salida
+        append_run_block(out, out_block, out_format)
     
     # Cierra todos los descriptores de archivo
     for handle in handles:
         handle.close()
+
+# --- FUNCIÓN 11: Planificar las pasadas de mezcla con fan-in acotado ---
+def plan_merge_passes(run_sizes, max_fan_in):
+    """
+    Decide qué runs se mezclan en cada pasada para que ninguna abra más de
+    max_fan_in archivos y el total de bytes reescritos sea mínimo.
+    
+    Es el patrón de mezcla óptimo (árbol de Huffman k-ario): siempre se mezclan
+    los runs más pequeños disponibles. La primera mezcla toma solo los runs
+    necesarios para que todas las siguientes usen el fan-in completo, así los
+    runs grandes se reescriben el menor número de veces posible.
+    
+    Args:
+        run_sizes (list): Tamaño en bytes de cada run inicial.
+        max_fan_in (int): Máximo de runs que se mezclan a la vez (>= 2).
+    
+    Returns:
+        list: Lista de pasos. Cada paso es la lista de índices de los runs a mezclar;
+              los runs iniciales son 0..n-1 y el paso j produce el run n+j.
+              El último paso produce la salida final.
+    """
+    if max_fan_in < 2:
+        raise ValueError(f"max_fan_in debe ser al menos 2, no {max_fan_in}")
+    
+    n = len(run_sizes)
+    if n == 0:
+        return []
+    
+    # Min-heap de (tamaño, índice_run) para tomar siempre los runs más pequeños
+    heap = [(size, idx) for idx, size in enumerate(run_sizes)]
+    heapq.heapify(heap)
+    
+    # Tamaño de la primera mezcla: deja un número de runs que encaja exacto
+    # en mezclas de max_fan_in (con un solo run, ese run es la salida)
+    group = 2 + (n - 2) % (max_fan_in - 1) if n > 1 else 1
+    
+    steps = []
+    next_idx = n
+    while True:
+        take = min(group, len(heap))
+        popped = [heapq.heappop(heap) for _ in range(take)]
+        steps.append([idx for _, idx in popped])
+        if not heap:
+            break
+        # El run resultante vuelve al heap con la suma de los tamaños
+        heapq.heappush(heap, (sum(size for size, _ in popped), next_idx))
+        next_idx += 1
+        group = max_fan_in
+    
+    return steps
+
+# --- FUNCIÓN 12: Reducir los runs con pasadas intermedias ---
+def reduce_runs(temp_files, run_format='text', memory_budget=MERGE_MEMORY_BUDGET,
+                max_fan_in=MAX_FAN_IN, engine='heap'):
+    """
+    Ejecuta las pasadas intermedias de la cascada (según plan_merge_passes) hasta
+    que solo quedan los runs de la última mezcla, que abre como mucho max_fan_in
+    archivos. Los runs ya mezclados se eliminan después de cada pasada.
+    
+    Args:
+        temp_files (list): Lista de nombres de archivos temporales.
+        run_format (str): Formato de los runs temporales: 'text' o 'binary'.
+        memory_budget (int): Bytes totales para los buffers de cada pasada.
+        max_fan_in (int): Máximo de runs abiertos a la vez.
+        engine (str): Motor de mezcla: 'heap' o 'loser_tree'.
+    
+    Returns:
+        list: Runs que forman la última mezcla (vacía si no había runs).
+    """
+    if run_format not in RUN_FORMATS:
+        raise ValueError(f"run_format debe ser uno de {RUN_FORMATS}, no {run_format!r}")
+    if engine not in MERGE_ENGINES:
+        raise ValueError(f"engine debe ser uno de {list(MERGE_ENGINES)}, no {engine!r}")
+    
+    # Planifica las pasadas a partir del tamaño real de cada run
+    steps = plan_merge_passes([os.path.getsize(file) for file in temp_files], max_fan_in)
+    if not steps:
+        return []
+    
+    # files[i] es el archivo del run i (iniciales primero, luego los intermedios)
+    files = list(temp_files)
+    extension = 'bin' if run_format == 'binary' else 'txt'
     
-    # Elimina los archivos temporales
-    for file in temp_files:
+    for j, step in enumerate(steps[:-1]):
+        # Las pasadas intermedias generan un run nuevo en el formato de los runs
+        inputs = [files[idx] for idx in step]
+        merged_file = f'temp_merge_{j}.{extension}'
+        merge_pass(inputs, merged_file, run_format, memory_budget, output_is_run=True,
+                   engine=engine)
+        files.append(merged_file)
+        
+        # Elimina los runs ya mezclados para liberar disco cuanto antes
+        for file in inputs:
+            os.remove(file)
+    
+    return [files[idx] for idx in steps[-1]]
+
+# --- FUNCIÓN 13: Mezcla multiway de los runs ordenados ---
+def multiway_merge(temp_files, output_file='sorted_output.txt', run_format='text',
+                   memory_budget=MERGE_MEMORY_BUDGET, max_fan_in=MAX_FAN_IN, engine='heap'):
+    """
+    Mezcla los archivos temporales (runs ordenados) en un único archivo ordenado usando un min-heap.
+    
+    El archivo de salida siempre es texto; run_format debe coincidir con el usado
+    en split_into_sorted_runs. memory_budget se reparte entre un buffer de lectura
+    por run y un buffer de salida (ver merge_buffer_size).
+    
+    Si hay más runs que max_fan_in, la mezcla se hace en cascada: varias pasadas
+    que generan runs intermedios (según plan_merge_passes) hasta que solo queda
+    uno, que se escribe en output_file.
+    
+    Args:
+        temp_files (list): Lista de nombres de archivos temporales.
+        output_file (str): Nombre del archivo de salida ordenado (por defecto 'sorted_output.txt').
+        run_format (str): Formato de los runs temporales: 'text' o 'binary'.
+        memory_budget (int): Bytes totales para los buffers de la mezcla (por defecto 64 MB).
+        max_fan_in (int): Máximo de runs abiertos a la vez (por defecto 512).
+        engine (str): Motor de mezcla: 'heap' (heapq) o 'loser_tree' (árbol de perdedores).
+    """
+    # Pasadas intermedias hasta que el resto cabe en una sola mezcla
+    inputs = reduce_runs(temp_files, run_format, memory_budget, max_fan_in, engine)
+    if not inputs:
+        # Entrada vacía: la salida se crea (o se trunca) igualmente vacía
+        open(output_file, 'w').close()
+        return
+    
+    # La última pasada escribe la salida final en texto
+    merge_pass(inputs, output_file, run_format, memory_budget, engine=engine)
+    
+    # Elimina los runs ya mezclados
+    for file in inputs:
         os.remove(file)
 
+# --- FUNCIÓN 14: Mezcla multiway en streaming ---
+def iter_multiway_merge(temp_files, run_format='text', memory_budget=MERGE_MEMORY_BUDGET,
+                        max_fan_in=MAX_FAN_IN, engine='heap'):
+    """
+    Igual que multiway_merge, pero en lugar de escribir la salida final devuelve
+    los números ordenados uno a uno a medida que se piden.
+    
+    Las pasadas intermedias (si hay más de max_fan_in runs) se hacen al pedir el
+    primer número; la última mezcla se consume de forma perezosa. Al agotar el
+    generador o cerrarlo (close(), o salir antes de tiempo de un for dentro de
+    sorted_stream) se cierran los archivos y se eliminan los runs restantes.
+    
+    Args:
+        temp_files (list): Lista de nombres de archivos temporales.
+        run_format (str): Formato de los runs temporales: 'text' o 'binary'.
+        memory_budget (int): Bytes totales para los buffers de la mezcla.
+        max_fan_in (int): Máximo de runs abiertos a la vez.
+        engine (str): Motor de mezcla: 'heap' o 'loser_tree'.
+    
+    Yields:
+        int: Los números de todos los runs, en orden.
+    """
+    inputs = []
+    handles = []
+    try:
+        # Pasadas intermedias hasta que el resto cabe en una sola mezcla
+        inputs = reduce_runs(temp_files, run_format, memory_budget, max_fan_in, engine)
+        
+        # Abre los runs de la última mezcla, cada uno con su parte del presupuesto
+        mode = 'rb' if run_format == 'binary' else 'r'
+        for file in inputs:
+            handles.append(open(file, mode))
+        buffer_bytes = merge_buffer_size(memory_budget, len(inputs))
+        readers = [read_run(handle, run_format, buffer_bytes) for handle in handles]
+        
+        yield from MERGE_ENGINES[engine](readers)
+    finally:
+        # Cierra los descriptores y elimina los runs, se haya consumido todo o no
+        for handle in handles:
+            handle.close()
+        for file in inputs:
+            if os.path.exists(file):
+                os.remove(file)
+
+# --- FUNCIÓN 15: Ordenamiento externo en streaming con limpieza automática ---
+@contextmanager
+def sorted_stream(filename, chunk_size=100_000, run_format='text', method='chunks',
+                  memory_limit=None, memory_budget=MERGE_MEMORY_BUDGET, max_fan_in=MAX_FAN_IN,
+                  engine='heap'):
+    """
+    Gestor de contexto que divide el archivo en runs y entrega un iterador con
+    los números ordenados, sin escribir ningún archivo de salida. Al salir del
+    bloque with (aunque no se haya consumido todo o haya una excepción) se
+    eliminan todos los archivos temporales.
+    
+    Ejemplo:
+        with sorted_stream('large_data.txt', run_format='binary') as numbers:
+            for num in numbers:
+                ...
+    
+    Args:
+        filename (str): Archivo de entrada (un número por línea).
+        chunk_size (int): Números por run (si no se usa memory_limit).
+        run_format (str): Formato de los runs temporales: 'text' o 'binary'.
+        method (str): 'chunks' o 'replacement' (ver split_into_sorted_runs).
+        memory_limit (int): Bytes máximos de cada run en memoria (opcional).
+        memory_budget (int): Bytes totales para los buffers de la mezcla.
+        max_fan_in (int): Máximo de runs abiertos a la vez.
+        engine (str): Motor de mezcla: 'heap' o 'loser_tree'.
+    
+    Yields:
+        generator: Iterador con los números ordenados.
+    """
+    temp_files = []
+    stream = None
+    try:
+        temp_files = split_into_sorted_runs(filename, chunk_size, run_format, method, memory_limit)
+        stream = iter_multiway_merge(temp_files, run_format, memory_budget, max_fan_in, engine)
+        yield stream
+    finally:
+        # Cerrar el generador borra sus runs; si nunca empezó, se borran aquí
+        if stream is not None:
+            stream.close()
+        for file in temp_files:
+            if os.path.exists(file):
+                os.remove(file)
+
+# --- FUNCIÓN 16: Dividir el archivo en runs RLE (valor, repeticiones) ---
+def split_into_rle_runs(filename, chunk_size=100_000, memory_limit=None):
+    """
+    Genera runs codificados por longitud de repetición: cada run es una lista
+    ordenada de pares (valor, repeticiones) guardados como int64 empaquetados.
+    
+    Los números se cuentan en un diccionario mientras se leen, así que el chunk
+    se corta al llegar a chunk_size valores DISTINTOS (o al ocupar memory_limit
+    bytes) y no al leer chunk_size números. Con pocas claves distintas (como las
+    10,000 de generate_large_file) todo el archivo cabe en muy pocos runs.
+    
+    Args:
+        filename (str): Nombre del archivo grande a procesar.
+        chunk_size (int): Valores distintos por run (por defecto 100,000).
+        memory_limit (int): Si se indica, el chunk se corta cuando el diccionario de
+                            conteos (medido con sys.getsizeof) ocupa estos bytes.
+    
+    Returns:
+        tuple: (temp_files, stats) con la lista de runs y un diccionario con
+               'runs', 'records' (números leídos) y 'pairs' (pares escritos).
+    """
+    temp_files = []
+    records = 0
+    pairs = 0
+    
+    def flush(counts):
+        # Escribe el chunk como pares (valor, repeticiones) ordenados por valor
+        nonlocal pairs
+        temp_file = f'temp_run_{len(temp_files)}.rle'
+        data = array(RUN_TYPECODE)
+        for num in sorted(counts):
+            data.append(num)
+            data.append(counts[num])
+        with open(temp_file, 'wb') as tf:
+            data.tofile(tf)
+        temp_files.append(temp_file)
+        pairs += len(counts)
+    
+    with open(filename, 'r') as f:
+        counts = {}  # valor -> repeticiones dentro del chunk actual
+        items_bytes = 0  # Bytes de las claves nuevas (modo memory_limit)
+        for line in f:
+            num = int(line)
+            records += 1
+            if num in counts:
+                counts[num] += 1
+                continue
+            counts[num] = 1
+            
+            # Solo una clave nueva puede llenar el chunk
+            if memory_limit is None:
+                full = len(counts) == chunk_size
+            else:
+                items_bytes += sys.getsizeof(num)
+                full = sys.getsizeof(counts) + items_bytes >= memory_limit
+            if full:
+                flush(counts)
+                counts = {}
+                items_bytes = 0
+        
+        if counts:
+            flush(counts)
+    
+    stats = {'runs': len(temp_files), 'records': records, 'pairs': pairs}
+    return temp_files, stats
+
+# --- FUNCIÓN 17: Leer un run RLE ---
+def read_rle_run(handle, buffer_bytes=None):
+    """
+    Generador que devuelve los pares (valor, repeticiones) de un run RLE abierto en 'rb'.
+    
+    Args:
+        handle (file): Archivo del run abierto en modo binario.
+        buffer_bytes (int): Tamaño del buffer de lectura.
+    
+    Yields:
+        tuple: (valor, repeticiones) en orden creciente de valor.
+    """
+    if buffer_bytes is None:
+        buffer_bytes = RUN_BLOCK_RECORDS * RLE_PAIR_SIZE
+    
+    # El bloque debe contener un número entero de pares
+    block_bytes = max(RLE_PAIR_SIZE, buffer_bytes - buffer_bytes % RLE_PAIR_SIZE)
+    while True:
+        data = handle.read(block_bytes)
+        if not data:
+            break
+        block = array(RUN_TYPECODE)
+        block.frombytes(data)
+        # Posiciones pares: valores; impares: repeticiones
+        yield from zip(block[::2], block[1::2])
+
+# --- FUNCIÓN 18: Mezcla de runs RLE que combina las cabezas iguales ---
+def rle_merge(readers):
+    """
+    Mezcla k runs RLE. Cuando varios runs tienen el mismo valor en cabeza se
+    combinan en un solo paso sumando sus repeticiones, así cada valor distinto
+    sale una sola vez y cuesta una operación de heap por run que lo contiene,
+    no una por cada repetición.
+    
+    Args:
+        readers (list): Iteradores de pares (valor, repeticiones) ordenados por valor.
+    
+    Yields:
+        tuple: (valor, repeticiones_totales) en orden creciente de valor.
+    """
+    heap = []  # Tuplas (valor, índice_run, repeticiones)
+    for i, reader in enumerate(readers):
+        pair = next(reader, None)
+        if pair is not None:
+            heap.append((pair[0], i, pair[1]))
+    heapq.heapify(heap)
+    
+    while heap:
+        num, i, total = heap[0]
+        
+        # Avanza el run de la cabeza y absorbe todas las cabezas con el mismo valor
+        while True:
+            pair = next(readers[i], None)
+            if pair is not None:
+                heapq.heapreplace(heap, (pair[0], i, pair[1]))
+            else:
+                heapq.heappop(heap)
+            if not heap or heap[0][0] != num:
+                break
+            _, i, count = heap[0]
+            total += count
+        
+        yield num, total
+
+# --- FUNCIÓN 19: Mezcla multiway de runs RLE (SORTED, DISTINCT o COUNT BY) ---
+def multiway_merge_rle(temp_files, output_file='sorted_output.txt', output='sorted',
+                       memory_budget=MERGE_MEMORY_BUDGET, max_fan_in=MAX_FAN_IN):
+    """
+    Mezcla runs RLE (de split_into_rle_runs) y escribe uno de tres resultados:
+    
+    - 'sorted': todos los números ordenados, un número por línea (como multiway_merge).
+    - 'distinct': cada valor distinto una sola vez (SELECT DISTINCT).
+    - 'count_by': líneas "valor,repeticiones" (SELECT valor, COUNT(*) ... GROUP BY valor).
+    
+    Si hay más de max_fan_in runs, las pasadas intermedias (según plan_merge_passes)
+    escriben runs RLE, que nunca son más grandes que la suma de las claves distintas.
+    
+    Args:
+        temp_files (list): Runs RLE a mezclar (se eliminan al terminar).
+        output_file (str): Archivo de salida en texto.
+        output (str): 'sorted', 'distinct' o 'count_by'.
+        memory_budget (int): Bytes totales para los buffers de la mezcla.
+        max_fan_in (int): Máximo de runs abiertos a la vez.
+    """
+    if output not in RLE_OUTPUTS:
+        raise ValueError(f"output debe ser uno de {RLE_OUTPUTS}, no {output!r}")
+    
+    steps = plan_merge_passes([os.path.getsize(file) for file in temp_files], max_fan_in)
+    files = list(temp_files)
+    
+    # Sin runs (entrada vacía) la salida queda vacía, igual que en multiway_merge
+    if not steps:
+        open(output_file, 'w').close()
+        return
+    
+    for j, step in enumerate(steps):
+        inputs = [files[idx] for idx in step]
+        is_last = j == len(steps) - 1
+        
+        handles = [open(file, 'rb') for file in inputs]
+        buffer_bytes = merge_buffer_size(memory_budget, len(inputs))
+        readers = [read_rle_run(handle, buffer_bytes) for handle in handles]
+        out_pairs = max(1, buffer_bytes // RLE_PAIR_SIZE)
+        out_block = []
+        
+        if is_last:
+            # El buffer de salida se mide en caracteres escritos, no en pares:
+            # en 'sorted' un solo par puede expandirse a millones de líneas.
+            # writelines evita la copia extra que haría ''.join al vaciarlo
+            out_chars = 0
+            with open(output_file, 'w') as out:
+                for num, count in rle_merge(readers):
+                    # Cada par se convierte en texto según la salida pedida
+                    if output == 'sorted':
+                        line = f"{num}\n"
+                        if len(line) * count > buffer_bytes:
+                            # Un valor muy repetido se escribe por trozos del tamaño
+                            # del buffer, después de vaciar lo pendiente para no desordenar
+                            out.writelines(out_block)
+                            out_block, out_chars = [], 0
+                            lines_per_chunk = max(1, buffer_bytes // len(line))
+                            while count > lines_per_chunk:
+                                out.write(line * lines_per_chunk)
+                                count -= lines_per_chunk
+                        piece = line * count
+                    elif output == 'distinct':
+                        piece = f"{num}\n"
+                    else:
+                        piece = f"{num},{count}\n"
+                    out_block.append(piece)
+                    out_chars += len(piece)
+                    if out_chars >= buffer_bytes:
+                        out.writelines(out_block)
+                        out_block, out_chars = [], 0
+                out.writelines(out_block)
+        else:
+            # Pasada intermedia: la salida es otro run RLE
+            merged_file = f'temp_merge_{j}.rle'
+            with open(merged_file, 'wb') as out:
+                for num, count in rle_merge(readers):
+                    out_block.append(num)
+                    out_block.append(count)
+                    if len(out_block) >= 2 * out_pairs:
+                        array(RUN_TYPECODE, out_block).tofile(out)
+                        out_block = []
+                array(RUN_TYPECODE, out_block).tofile(out)
+            files.append(merged_file)
+        
+        for handle in handles:
+            handle.close()
+        for file in inputs:
+            os.remove(file)
+
+# --- FUNCIÓN 20: Ordenamiento externo por conteo para dominios acotados ---
+def counting_external_sort(filename, output_file='sorted_output.txt', domain=None,
+                           memory_budget=MERGE_MEMORY_BUDGET, run_format='binary',
+                           max_fan_in=MAX_FAN_IN):
+    """
+    Ordena el archivo sin crear runs cuando el dominio de valores es pequeño: una
+    sola lectura construye el histograma (fase de conteo de counting sort) y la
+    salida se escribe directamente desde los conteos, en orden de valor.
+    
+    El dominio puede indicarse con domain=(mínimo, máximo) o detectarse durante la
+    misma lectura: el histograma se amplía cuando llega un bloque con valores fuera
+    del rango visto. Si el dominio necesita más de memory_budget bytes de casillas,
+    se abandona el conteo y se ordena con runs (split_into_sorted_runs +
+    multiway_merge) con el mismo presupuesto, leyendo la entrada desde el principio.
+    
+    Args:
+        filename (str): Archivo de entrada (un número por línea).
+        output_file (str): Archivo de salida ordenado.
+        domain (tuple): (mínimo, máximo) de los valores, si se conoce.
+        memory_budget (int): Bytes para el histograma (y para la mezcla si hay respaldo).
+        run_format (str): Formato de los runs si hay que volver a ellos.
+        max_fan_in (int): Máximo de runs abiertos a la vez en el respaldo.
+    
+    Returns:
+        str: 'counting' si bastó el histograma o 'runs' si se usó el respaldo.
+    """
+    max_slots = max(1, memory_budget // COUNT_SLOT_BYTES)
+    
+    def fallback():
+        # El dominio no cabe en memoria: ordenamiento externo con runs
+        temp_files = split_into_sorted_runs(filename, run_format=run_format,
+                                            memory_limit=memory_budget)
+        multiway_merge(temp_files, output_file, run_format, memory_budget, max_fan_in)
+        return 'runs'
+    
+    if domain is not None:
+        low, high = domain
+        if high - low + 1 > max_slots:
+            return fallback()
+        count = array(RUN_TYPECODE, [0]) * (high - low + 1)
+    else:
+        low = high = None
+        count = array(RUN_TYPECODE)
+    
+    # Fase 1: conteo en una sola lectura, por bloques de líneas
+    with open(filename, 'r') as f:
+        while True:
+            lines = f.readlines(RUN_BLOCK_RECORDS * RUN_RECORD_SIZE)
+            if not lines:
+                break
+            nums = list(map(int, lines))
+            block_low, block_high = min(nums), max(nums)
+            
+            if domain is not None:
+                if block_low < low or block_high > high:
+                    bad = block_low if block_low < low else block_high
+                    raise ValueError(f"El valor {bad} está fuera del dominio {domain}")
+            elif low is None or block_low < low or block_high > high:
+                # Dominio detectado: amplía el histograma para cubrir el bloque
+                new_low = block_low if low is None else min(low, block_low)
+                new_high = block_high if high is None else max(high, block_high)
+                if new_high - new_low + 1 > max_slots:
+                    return fallback()
+                zero = array(RUN_TYPECODE, [0])
+                if low is None:
+                    count = zero * (new_high - new_low + 1)
+                else:
+                    count = zero * (low - new_low) + count + zero * (new_high - high)
+                low, high = new_low, new_high
+            
+            for num in nums:
+                count[num - low] += 1
+    
+    # Fase 2: la salida se escribe desde los conteos, valor por valor
+    out_records = RUN_BLOCK_RECORDS
+    with open(output_file, 'w') as out:
+        out_block = []
+        pending = 0  # Números acumulados en out_block
+        for offset, c in enumerate(count):
+            if not c:
+                continue
+            line = f"{low + offset}\n"
+            if c > out_records:
+                # Un valor muy repetido se escribe por trozos de out_records líneas,
+                # después de vaciar lo pendiente para conservar el orden
+                out.write(''.join(out_block))
+                out_block = []
+                pending = 0
+                while c > out_records:
+                    out.write(line * out_records)
+                    c -= out_records
+            out_block.append(line * c)
+            pending += c
+            if pending >= out_records:
+                out.write(''.join(out_block))
+                out_block = []
+                pending = 0
+        out.write(''.join(out_block))
+    
+    return 'counting'
+
+# --- FUNCIÓN 21: Dividir el archivo en runs ordenados con numpy ---
+def split_into_sorted_runs_numpy(filename, chunk_size=100_000, run_format='text',
+                                 memory_limit=None):
+    """
+    Versión vectorizada de split_into_sorted_runs (method='chunks'): cada chunk se
+    lee como un bloque de bytes, se convierte de una vez en un arreglo int64
+    (np.fromstring) y se ordena en sitio (sort(kind='stable')). Los runs binarios
+    se escriben con una sola escritura, sin crear ningún objeto int de Python por
+    número; los de texto, por trozos.
+    
+    El bloque se recorta en su último salto de línea (y la lectura retrocede hasta
+    ahí) para no partir números. Sin memory_limit mide unas chunk_size líneas
+    (según los bytes medios por línea del inicio del archivo). Con memory_limit
+    mide memory_limit // NUMPY_BLOCK_DIVISOR bytes: cada línea tiene al menos
+    2 bytes y ocupa 8 en el arreglo (hasta 4 veces el bloque, algo más mientras
+    se parsea), y el ordenamiento estable en sitio puede pedir un búfer de la
+    mitad del arreglo; bloque, arreglo y búfer juntos quedan por debajo del límite.
+    Los runs de texto se escriben por trozos acotados por el mismo límite.
+    
+    Args:
+        filename (str): Nombre del archivo grande a procesar.
+        chunk_size (int): Números aproximados por chunk (por defecto 100,000).
+        run_format (str): Formato de los runs temporales: 'text' o 'binary'.
+        memory_limit (int): Bytes máximos de cada chunk en memoria (opcional).
+    
+    Returns:
+        list: Lista con los nombres de los archivos temporales generados.
+    """
+    if np is None:
+        raise ImportError("split_into_sorted_runs_numpy necesita numpy")
+    if run_format not in RUN_FORMATS:
+        raise ValueError(f"run_format debe ser uno de {RUN_FORMATS}, no {run_format!r}")
+    
+    temp_files = []
+    extension = 'bin' if run_format == 'binary' else 'txt'
+    
+    with open(filename, 'rb') as f:
+        if memory_limit is None:
+            # Bytes medios por línea estimados con el primer bloque del archivo
+            sample = f.read(RUN_BLOCK_RECORDS)
+            f.seek(0)
+            line_bytes = max(1.0, len(sample) / max(1, sample.count(b'\n')))
+            chunk_bytes = max(1, int(chunk_size * line_bytes))
+        else:
+            chunk_bytes = max(1, memory_limit // NUMPY_BLOCK_DIVISOR)
+        
+        # Registros por escritura de un run de texto: cada uno pasa por un int, un
+        # str y una casilla de lista de Python (~100 bytes); con memory_limit se
+        # limita a unos 3 bloques de bytes, el hueco que dejan libre bloque y búfer
+        text_block = RUN_BLOCK_RECORDS
+        if memory_limit is not None:
+            text_block = max(1, min(RUN_BLOCK_RECORDS, chunk_bytes // 32))
+        
+        while True:
+            data = f.read(chunk_bytes)
+            if not data:
+                break
+            if not data.endswith(b'\n'):
+                end = data.rfind(b'\n') + 1
+                if end:
+                    # Recorta la línea incompleta y retrocede para leerla en el
+                    # siguiente bloque (sin concatenar el bloque con readline)
+                    f.seek(end - len(data), os.SEEK_CUR)
+                    data = data[:end]
+                else:
+                    # Una sola línea más larga que el bloque (o la última sin salto)
+                    data += f.readline()
+            
+            # Parseo vectorizado y ordenamiento en sitio (sin una segunda copia)
+            chunk = np.fromstring(data, dtype=np.int64, sep=' ')
+            del data
+            if not len(chunk):
+                continue
+            chunk.sort(kind='stable')
+            
+            temp_file = f'temp_run_{len(temp_files)}.{extension}'
+            if run_format == 'binary':
+                # Mismo formato que array('q'): int64 con el orden de bytes de la máquina
+                chunk.tofile(temp_file)
+            else:
+                # Por bloques de text_block: tolist() de todo el chunk crearía un
+                # int de Python por número y una cadena del tamaño del run
+                with open(temp_file, 'w') as tf:
+                    for start in range(0, len(chunk), text_block):
+                        if start:
+                            tf.write('\n')
+                        block = chunk[start:start + text_block].tolist()
+                        tf.write('\n'.join(map(str, block)))
+            temp_files.append(temp_file)
+    
+    return temp_files
+
+# --- FUNCIÓN 22: Benchmark de la creación de runs (Python vs numpy) ---
+def benchmark_run_creation(sizes=(1_000_000, 100_000_000), chunk_size=1_000_000,
+                           run_format='binary', max_num=10_000):
+    """
+    Mide números por segundo al crear los runs con el camino de Python (readline,
+    int() y sorted()) y con el vectorizado de numpy, para cada tamaño de entrada.
+    Los archivos de prueba y los runs se eliminan al terminar.
+    
+    Args:
+        sizes (tuple): Cantidades de números a probar (por defecto 1M y 100M).
+        chunk_size (int): Números por run.
+        run_format (str): Formato de los runs: 'text' o 'binary'.
+        max_num (int): Valor máximo de los números generados.
+    
+    Returns:
+        dict: {tamaño: {'python': números/s, 'numpy': números/s}}.
+    """
+    if np is None:
+        raise ImportError("benchmark_run_creation necesita numpy")
+    
+    results = {}
+    for size in sizes:
+        filename = f'bench_{size}.txt'
+        # La entrada se genera por bloques con numpy (generate_large_file sería lento)
+        rng = np.random.default_rng(0)
+        with open(filename, 'w') as f:
+            for start in range(0, size, RUN_BLOCK_RECORDS * 16):
+                block = rng.integers(1, max_num + 1, min(RUN_BLOCK_RECORDS * 16, size - start))
+                f.write('\n'.join(map(str, block.tolist())) + '\n')
+        
+        results[size] = {}
+        try:
+            for name, use_numpy in (('python', False), ('numpy', True)):
+                start = time.perf_counter()
+                temp_files = split_into_sorted_runs(filename, chunk_size, run_format,
+                                                    use_numpy=use_numpy)
+                elapsed = time.perf_counter() - start
+                for file in temp_files:
+                    os.remove(file)
+                results[size][name] = size / elapsed
+                print(f"{size:>12,} números | {name:<6} | {size / elapsed:>14,.0f} números/s")
+        finally:
+            os.remove(filename)
+    
+    return results
+
 # --- EJECUCIÓN PRINCIPAL ---
 if __name__ == "__main__":
     # Nombre del archivo de entrada y salida
     input_file = 'large_data.txt'
     output_file = 'sorted_data.txt'
+    memory_limit = 16 * 1024 * 1024  # 16 MB para los runs y para la mezcla
     
     # Paso 1: Generar archivo con datos aleatorios
     print("✅ Generando archivo grande con datos aleatorios...")
     generate_large_file(input_file, size=1_000_000)
     
-    # Paso 2: Dividir en runs ordenados
+    # Paso 2: Dividir en runs ordenados (runs binarios para evitar parsear texto)
     print("🔀 Dividiendo en runs ordenados...")
-    temp_files = split_into_sorted_runs(input_file, chunk_size=100_000)
+    # (selección por reemplazo: runs del doble de largo y la mitad de runs que mezclar)
+    temp_files = split_into_sorted_runs(input_file, run_format='binary', method='replacement',
+                                        memory_limit=memory_limit)
     
     # Paso 3: Mezclar multiway
     print("🧠 Mezclando multiway...")
-    multiway_merge(temp_files, output_file)
+    multiway_merge(temp_files, output_file, run_format='binary', memory_budget=memory_limit,
+                   max_fan_in=16)
     
     # Mensaje final
-    print(f"✨ ¡Datos ordenados guardados en '{output_file}'!")
\ No newline at end of file
+    print(f"✨ ¡Datos ordenados guardados en '{output_file}'!")
+    
+    # Paso 4: Versión en streaming: solo los 10 primeros, sin escribir la salida
+    print("🔎 Primeros 10 números (streaming, sin archivo de salida)...")
+    with sorted_stream(input_file, run_format='binary', memory_limit=memory_limit) as numbers:
+        first = [num for _, num in zip(range(10), numbers)]
+    print(f"   {first}")
+    
+    # Paso 5: Runs RLE (valor, repeticiones): solo 10,000 claves distintas en 1M números
+    print("🗜️ Runs RLE y conteo por valor (COUNT BY)...")
+    rle_files, rle_stats = split_into_rle_runs(input_file, memory_limit=memory_limit)
+    print(f"   {rle_stats['records']} números en {rle_stats['pairs']} pares "
+          f"({rle_stats['runs']} runs)")
+    multiway_merge_rle(rle_files, 'count_by_data.txt', output='count_by')
+    print("   Conteos guardados en 'count_by_data.txt'")
+    
+    # Paso 6: Dominio acotado (1..10,000): conteo en una pasada, sin runs
+    print("🔢 Ordenamiento por conteo (dominio acotado)...")
+    method = counting_external_sort(input_file, 'counted_data.txt', memory_budget=memory_limit)
+    print(f"   Método usado: {method}; resultado en 'counted_data.txt'")
+    
+    # Paso 7: Benchmark de creación de runs (solo 1M: 100M necesita más de 1 GB de disco)
+    if np is not None:
+        print("⏱️ Benchmark de creación de runs (Python vs numpy)...")
+        benchmark_run_creation(sizes=(1_000_000,))
\ No newline at end of file
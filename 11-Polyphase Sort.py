@@ -1,4 +1,10 @@
+import heapq
+import os
+import pickle
 import random
+import shutil
+import tempfile
+from collections import deque
 
 # Función que genera un pedido aleatorio con su número de ticket y descripción
 def generar_pedido(ticket):
@@ -18,46 +24,203 @@ def dividir_en_runs(lista, tamaño_run):
         runs.append(run)  # Agrega el bloque ordenado a la lista de runs
     return runs
 
-# Fusión de dos runs ordenadas, similar al merge de Merge Sort
-def fusionar_runs(run1, run2):
-    resultado = []  # Lista vacía donde se guardará la fusión ordenada
-    i = j = 0  # Índices para recorrer run1 y run2
+# Una "cinta" es un archivo temporal que se lee y escribe solo de forma secuencial.
+# Guarda en memoria únicamente la longitud de cada run que contiene (no los datos)
+# y cuántos runs ficticios (dummy) tiene al principio.
+class Cinta:
+    def __init__(self, ruta):
+        self.ruta = ruta  # Archivo temporal que hace de cinta
+        self.runs = deque()  # Longitudes de los runs reales, en orden de lectura
+        self.dummies = 0  # Runs ficticios (vacíos) que se consumen antes que los reales
+        self.archivo = None  # Archivo abierto (en escritura o en lectura)
 
-    while i < len(run1) and j < len(run2):
-        if run1[i] <= run2[j]:
-            resultado.append(run1[i])
-            i += 1
+    # Número total de runs en la cinta, contando los ficticios
+    def total_runs(self):
+        return len(self.runs) + self.dummies
+
+    # Rebobina la cinta y la prepara para escribir desde el principio (borra su contenido)
+    def abrir_escritura(self):
+        self.cerrar()
+        self.archivo = open(self.ruta, 'wb')
+
+    # Rebobina la cinta y la prepara para leer desde el principio
+    def abrir_lectura(self):
+        self.cerrar()
+        self.archivo = open(self.ruta, 'rb')
+
+    def cerrar(self):
+        if self.archivo:
+            self.archivo.close()
+            self.archivo = None
+
+    # Escribe un registro al final de la cinta
+    def escribir(self, registro):
+        pickle.dump(registro, self.archivo)
+
+    # Generador que lee los 'longitud' registros del siguiente run de la cinta
+    def leer_run(self, longitud):
+        for _ in range(longitud):
+            yield pickle.load(self.archivo)
+
+# Calcula cuántos runs debe recibir cada cinta de entrada (distribución de Fibonacci
+# generalizada). Con 3 cintas (2 de entrada) salen números de Fibonacci: 1-1, 2-1, 3-2, 5-3...
+# Con más cintas cada nivel se obtiene sumando al mayor del nivel anterior cada uno de los demás.
+def distribucion_fibonacci(num_runs, num_cintas):
+    k = num_cintas - 1  # Cintas de entrada (una queda siempre libre como salida)
+    objetivo = [1] * k  # Primer nivel: un run por cinta
+    while sum(objetivo) < num_runs:
+        mayor = objetivo[0]
+        objetivo = [mayor + objetivo[i + 1] for i in range(k - 1)] + [mayor]
+    return objetivo
+
+# Reparte los runs iniciales entre las cintas de entrada según la distribución de Fibonacci.
+# Lo que falta para completar el nivel se rellena con runs ficticios, repartidos
+# por igual entre las cintas para que cada mezcla tenga el mayor número de runs reales.
+def distribuir_runs(runs, cintas):
+    entradas = cintas[:-1]
+    objetivo = distribucion_fibonacci(len(runs), len(cintas))
+
+    # Reparto de runs ficticios en ronda, sin pasarse del objetivo de cada cinta
+    faltantes = sum(objetivo) - len(runs)
+    i = 0
+    while faltantes > 0:
+        if entradas[i].dummies < objetivo[i]:
+            entradas[i].dummies += 1
+            faltantes -= 1
+        i = (i + 1) % len(entradas)
+
+    # Escritura de los runs reales: cada cinta recibe objetivo - ficticios runs
+    siguiente = iter(runs)
+    for cinta, cantidad in zip(entradas, objetivo):
+        cinta.abrir_escritura()
+        for _ in range(cantidad - cinta.dummies):
+            run = next(siguiente)
+            for registro in run:
+                cinta.escribir(registro)
+            cinta.runs.append(len(run))
+
+# Mezcla el siguiente run de cada cinta activa con un min-heap y lo escribe en la salida.
+# Devuelve la cantidad de registros escritos.
+def mezclar_un_run(activas, salida):
+    lectores = [cinta.leer_run(cinta.runs.popleft()) for cinta in activas]
+    heap = []
+    for i, lector in enumerate(lectores):
+        registro = next(lector, None)
+        if registro is not None:
+            heap.append((registro, i))
+    heapq.heapify(heap)
+
+    escritos = 0
+    while heap:
+        registro, i = heap[0]
+        salida.escribir(registro)
+        escritos += 1
+        siguiente = next(lectores[i], None)
+        if siguiente is not None:
+            heapq.heapreplace(heap, (siguiente, i))
         else:
-            resultado.append(run2[j])
-            j += 1
+            heapq.heappop(heap)
+    return escritos
 
-    # Agrega lo que sobra de cada run
-    resultado.extend(run1[i:])
-    resultado.extend(run2[j:])
-    return resultado
+# Polyphase Sort externo sobre 'num_cintas' archivos temporales.
+# En cada fase se mezclan runs de todas las cintas de entrada sobre la cinta vacía,
+# hasta que una de las entradas se agota; esa pasa a ser la salida de la fase siguiente.
+# Devuelve la lista ordenada y una lista con el volumen de E/S de cada fase.
+def polyphase_sort_externo(pedidos, tamaño_run=4, num_cintas=3, directorio=None):
+    if num_cintas < 3:
+        raise ValueError("Polyphase Sort necesita al menos 3 cintas")
 
-# Implementación simplificada de Polyphase Sort usando 3 cintas (listas)
-def polyphase_sort(pedidos, tamaño_run=4):
     runs = dividir_en_runs(pedidos, tamaño_run)  # Paso 1: dividir en runs ordenadas
-    buffer = []  # Buffer temporal para almacenar fusiones
+    if len(runs) <= 1:
+        return (runs[0] if runs else []), []
+
+    # Si no se indica un directorio, se usa uno temporal que se borra al terminar
+    directorio_propio = directorio is None
+    if directorio_propio:
+        directorio = tempfile.mkdtemp(prefix="polyphase_")
+    cintas = [Cinta(os.path.join(directorio, f"cinta_{i}.bin")) for i in range(num_cintas)]
+    estadisticas = []
+
+    try:
+        # Fase 0: distribución de Fibonacci de los runs iniciales
+        distribuir_runs(runs, cintas)
+        estadisticas.append({
+            'fase': 0,
+            'mezclas': 0,
+            'registros_leidos': 0,
+            'registros_escritos': len(pedidos),
+            'bytes_leidos': 0,
+            'bytes_escritos': sum(c.archivo.tell() for c in cintas if c.archivo),
+        })
+        for cinta in cintas[:-1]:
+            cinta.abrir_lectura()
+
+        salida = cintas[-1]  # La última cinta empieza vacía
+        fase = 0
+        while sum(c.total_runs() for c in cintas) > 1:
+            fase += 1
+            entradas = [c for c in cintas if c is not salida]
+            mezclas = min(c.total_runs() for c in entradas)  # Hasta agotar la cinta más corta
+            posiciones = [c.archivo.tell() for c in entradas]
+            salida.abrir_escritura()
+            registros = 0
+
+            for _ in range(mezclas):
+                # Los runs ficticios no se leen: solo se descuentan
+                activas = []
+                for cinta in entradas:
+                    if cinta.dummies > 0:
+                        cinta.dummies -= 1
+                    else:
+                        activas.append(cinta)
 
-    # Mientras haya más de una run para fusionar
-    while len(runs) > 1:
-        new_runs = []  # Lista para nuevas runs tras fusión
+                if activas:
+                    escritos = mezclar_un_run(activas, salida)
+                    salida.runs.append(escritos)
+                    registros += escritos
+                else:
+                    # Si todas las entradas eran ficticias, el resultado también lo es
+                    salida.dummies += 1
 
-        # Se fusionan de dos en dos
-        for i in range(0, len(runs), 2):
-            if i + 1 < len(runs):
-                # Si hay pareja para fusionar
-                fusion = fusionar_runs(runs[i], runs[i + 1])
-                new_runs.append(fusion)
-            else:
-                # Si queda una sola run sin pareja, se pasa tal cual
-                new_runs.append(runs[i])
+            estadisticas.append({
+                'fase': fase,
+                'mezclas': mezclas,
+                'registros_leidos': registros,
+                'registros_escritos': registros,
+                'bytes_leidos': sum(c.archivo.tell() - p for c, p in zip(entradas, posiciones)),
+                'bytes_escritos': salida.archivo.tell(),
+            })
 
-        runs = new_runs  # Actualizamos las runs a las nuevas fusionadas
+            # La salida se rebobina para leerla y la cinta agotada pasa a ser la nueva salida
+            salida.abrir_lectura()
+            salida = next(c for c in entradas if c.total_runs() == 0)
 
-    return runs[0]  # Solo queda una run, que es la lista completamente ordenada
+        # Solo queda un run real: lo leemos completo
+        final = next(c for c in cintas if c.runs)
+        ordenados = list(final.leer_run(final.runs.popleft()))
+    finally:
+        for cinta in cintas:
+            cinta.cerrar()
+        if directorio_propio:
+            shutil.rmtree(directorio, ignore_errors=True)
+
+    return ordenados, estadisticas
+
+# Polyphase Sort usando 3 cintas (archivos temporales); devuelve solo la lista ordenada
+def polyphase_sort(pedidos, tamaño_run=4, num_cintas=3):
+    ordenados, _ = polyphase_sort_externo(pedidos, tamaño_run, num_cintas)
+    return ordenados
+
+# Muestra el volumen de E/S de cada fase para compararlo con una mezcla balanceada
+def mostrar_estadisticas(estadisticas, total_registros):
+    print("📊 E/S por fase (fase 0 = distribución inicial):")
+    for e in estadisticas:
+        print(f"   Fase {e['fase']}: {e['mezclas']} mezclas, "
+              f"{e['registros_leidos']} registros leídos / {e['registros_escritos']} escritos, "
+              f"{e['bytes_leidos']} B leídos / {e['bytes_escritos']} B escritos")
+    # Pasadas equivalentes: cuántas veces se copió el archivo completo durante las mezclas
+    copiados = sum(e['registros_escritos'] for e in estadisticas[1:])
+    print(f"   Pasadas equivalentes sobre los datos: {copiados / max(1, total_registros):.2f}")
 
 # Función para mostrar los pedidos de forma legible
 def mostrar_pedidos(pedidos):
@@ -70,7 +233,11 @@ if __name__ == "__main__":
     print("📋 Pedidos desordenados:")
     mostrar_pedidos(pedidos)
 
-    pedidos_ordenados = polyphase_sort(pedidos, tamaño_run=4)  # Ordenamos con Polyphase Sort
+    # Ordenamos con Polyphase Sort sobre 3 cintas (archivos temporales)
+    pedidos_ordenados, estadisticas = polyphase_sort_externo(pedidos, tamaño_run=4, num_cintas=3)
 
     print("\n✅ Pedidos ordenados por número de ticket (Polyphase Sort):")
     mostrar_pedidos(pedidos_ordenados)
+
+    print()
+    mostrar_estadisticas(estadisticas, len(pedidos))
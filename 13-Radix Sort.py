@@ -1,3 +1,33 @@
+# Importamos time para medir el rendimiento del motor base 256
+import time
+
+# random y struct para las claves flotantes sin NumPy
+import random
+import struct
+
+# NumPy es opcional: si está instalado, el motor base 256 se vectoriza
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Número de bits que se procesan en cada pasada del motor base 256 (un byte)
+RADIX_BITS = 8
+RADIX_BASE = 1 << RADIX_BITS
+RADIX_MASK = RADIX_BASE - 1
+
+# La versión NumPy procesa dos bytes por pasada (ver orden_lsd_uint64)
+NUMPY_DIGIT_BITS = 2 * RADIX_BITS
+
+# Límites de int64: fuera de ellos el motor NumPy no puede representar las claves
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# Bit de signo de un double IEEE-754 y máscara de 64 bits
+SIGN_BIT = 1 << 63
+MASK_64 = (1 << 64) - 1
+
+
 # ------------------------------------------
 # Función que aplica el algoritmo Radix Sort a una lista de enteros (puntuaciones)
 # ------------------------------------------
@@ -74,6 +104,309 @@ def conteo_por_digito(puntuaciones, exp):
         puntuaciones[i] = output[i]
 
 
+# ------------------------------------------
+# Motor Radix Sort base 256 (LSD) con soporte para negativos y carga asociada
+# ------------------------------------------
+
+def radix_sort_256(claves, valores=None):
+    """
+    Ordena claves enteras (con signo) byte a byte y, opcionalmente, una carga
+    (valores) asociada a cada clave en la misma pasada.
+
+    Es estable: las claves iguales conservan su orden original, de modo que
+    los valores empatados también. Usa NumPy si está disponible y las claves
+    caben en int64; si no, recurre a la versión en Python puro.
+
+    Args:
+        claves (list | np.ndarray): Claves enteras, pueden ser negativas.
+        valores (list | np.ndarray): Carga opcional, del mismo largo que claves.
+
+    Returns:
+        list | np.ndarray | tuple: Las claves ordenadas o, si se pasó carga,
+        la tupla (claves_ordenadas, valores_ordenados). Se devuelve el mismo
+        tipo de contenedor que se recibió (lista o arreglo de NumPy).
+    """
+    if valores is not None and len(valores) != len(claves):
+        raise ValueError("claves y valores deben tener el mismo largo")
+
+    # Elegimos el motor: NumPy solo si las claves caben en int64
+    usar_numpy = np is not None and len(claves) > 0
+    if np is not None and isinstance(claves, np.ndarray):
+        # Un arreglo ya trae su tipo: solo se aceptan enteros con o sin signo
+        if claves.dtype.kind not in "iu":
+            raise TypeError(f"radix_sort_256 ordena claves enteras, no dtype {claves.dtype}; "
+                            "para flotantes usa radix_sort_float")
+    elif usar_numpy:
+        usar_numpy = INT64_MIN <= min(claves) and max(claves) <= INT64_MAX
+
+    if usar_numpy:
+        orden = orden_radix_256_numpy(claves)
+    else:
+        orden = orden_radix_256_python(claves)
+
+    # Aplicamos la permutación a las claves y a la carga
+    claves_ordenadas = aplicar_orden(claves, orden)
+    if valores is None:
+        return claves_ordenadas
+    return claves_ordenadas, aplicar_orden(valores, orden)
+
+
+def orden_radix_256_numpy(claves):
+    """
+    Calcula la permutación estable que ordena claves enteras usando NumPy.
+
+    Args:
+        claves (list | np.ndarray): Claves dentro del rango de int64, o un
+            arreglo de enteros sin signo (hasta uint64).
+
+    Returns:
+        np.ndarray: Índices que ordenan las claves.
+    """
+    # Los enteros sin signo ya tienen el orden de uint64: no hace falta el truco
+    if isinstance(claves, np.ndarray) and claves.dtype.kind == "u":
+        return orden_lsd_uint64(claves.astype(np.uint64, copy=False))
+
+    claves = np.asarray(claves, dtype=np.int64)
+
+    # Truco del bit de signo: al invertirlo, el orden de int64 coincide con el
+    # orden de uint64, así los negativos quedan antes que los positivos
+    return orden_lsd_uint64(claves.view(np.uint64) ^ np.uint64(1 << 63))
+
+
+def orden_lsd_uint64(sin_signo):
+    """
+    Pasadas LSD base 256 sobre claves uint64 ya transformadas para que su
+    orden sin signo coincida con el orden deseado.
+
+    Args:
+        sin_signo (np.ndarray): Claves uint64.
+
+    Returns:
+        np.ndarray: Índices que ordenan las claves (permutación estable).
+    """
+    if sin_signo.size == 0:
+        return np.arange(0)
+
+    # Restamos el mínimo para saltarnos los bytes altos que son iguales en todas
+    # las claves (p. ej. puntuaciones < 65536 solo necesitan una pasada)
+    sin_signo = sin_signo - sin_signo.min()
+    pasadas = (int(sin_signo.max()).bit_length() + NUMPY_DIGIT_BITS - 1) // NUMPY_DIGIT_BITS
+
+    orden = np.arange(sin_signo.size)
+    for pasada in range(pasadas):
+        # Extraemos los dos bytes actuales de cada clave
+        digito = (sin_signo >> np.uint64(pasada * NUMPY_DIGIT_BITS)).astype(np.uint16)
+
+        # argsort estable sobre uint16 es, dentro de NumPy, un radix de dos
+        # pasadas de un byte: agrupar dos bytes ahorra la mitad de reordenamientos
+        paso = np.argsort(digito, kind="stable")
+
+        # Reordenamos las claves restantes y componemos la permutación
+        sin_signo = sin_signo[paso]
+        orden = orden[paso]
+
+    return orden
+
+
+def orden_radix_256_python(claves):
+    """
+    Calcula la permutación estable que ordena claves enteras en Python puro.
+
+    A diferencia de conteo_por_digito, no crea una lista de salida en cada
+    pasada: alterna entre dos listas de índices ya reservadas.
+
+    Args:
+        claves (list): Claves enteras de cualquier tamaño, pueden ser negativas.
+
+    Returns:
+        list: Índices que ordenan las claves.
+    """
+    n = len(claves)
+    if n == 0:
+        return []
+
+    # Desplazamos por el mínimo para trabajar solo con enteros no negativos
+    minimo = min(claves)
+    desplazadas = [c - minimo for c in claves]
+    max_val = max(desplazadas)
+
+    # Dos listas de índices que se intercambian en cada pasada
+    orden = list(range(n))
+    auxiliar = [0] * n
+
+    shift = 0
+    while max_val >> shift > 0:
+        # Contamos cuántas claves tienen cada valor de byte en esta posición
+        count = [0] * RADIX_BASE
+        for i in orden:
+            count[(desplazadas[i] >> shift) & RADIX_MASK] += 1
+
+        # Convertimos los conteos en la posición inicial de cada byte
+        inicio = 0
+        for d in range(RADIX_BASE):
+            count[d], inicio = inicio, inicio + count[d]
+
+        # Colocamos los índices en orden de entrada (estable) en la lista auxiliar
+        for i in orden:
+            d = (desplazadas[i] >> shift) & RADIX_MASK
+            auxiliar[count[d]] = i
+            count[d] += 1
+
+        # La lista auxiliar pasa a ser el orden actual y reutilizamos la anterior
+        orden, auxiliar = auxiliar, orden
+        shift += RADIX_BITS
+
+    return orden
+
+
+def aplicar_orden(datos, orden):
+    """
+    Reordena datos según una permutación, respetando el tipo de contenedor.
+
+    Args:
+        datos (list | np.ndarray): Datos a reordenar.
+        orden (list | np.ndarray): Índices producidos por el motor radix.
+
+    Returns:
+        list | np.ndarray: Datos reordenados (lista si se recibió una lista).
+    """
+    if np is not None and isinstance(datos, np.ndarray):
+        return datos[np.asarray(orden, dtype=np.intp)]
+    if np is not None and isinstance(orden, np.ndarray):
+        orden = orden.tolist()
+    return [datos[i] for i in orden]
+
+
+# ------------------------------------------
+# Radix Sort para flotantes IEEE-754 (doubles)
+# ------------------------------------------
+
+def clave_float_ordenable(x, nan_al_final=True):
+    """
+    Convierte un double en un entero de 64 bits sin signo con el mismo orden.
+
+    Truco del signo: si el número es positivo se enciende el bit de signo
+    (queda por encima de todos los negativos); si es negativo se invierten
+    todos los bits (cuanto más negativo, menor la clave). Los NaN se llevan
+    a un extremo y -0.0 se trata igual que 0.0, como hace sorted().
+
+    Args:
+        x (float): Valor a convertir.
+        nan_al_final (bool): True para colocar los NaN al final, False al inicio.
+
+    Returns:
+        int: Clave entera entre 0 y 2**64 - 1.
+    """
+    # Ningún double real produce las claves 0 ni 2**64 - 1, quedan libres para NaN
+    if x != x:
+        return MASK_64 if nan_al_final else 0
+
+    # Sumar 0.0 convierte -0.0 en 0.0 para que ambos empaten
+    bits = struct.unpack("<Q", struct.pack("<d", x + 0.0))[0]
+    if bits & SIGN_BIT:
+        return bits ^ MASK_64
+    return bits | SIGN_BIT
+
+
+def claves_float_ordenables_numpy(claves, nan_al_final=True):
+    """
+    Versión vectorizada de clave_float_ordenable para un arreglo completo.
+
+    Args:
+        claves (list | np.ndarray): Valores flotantes.
+        nan_al_final (bool): True para colocar los NaN al final, False al inicio.
+
+    Returns:
+        np.ndarray: Claves uint64 con el mismo orden que los flotantes.
+    """
+    # Copia en float64 (+ 0.0 también normaliza -0.0) para no alterar la entrada
+    valores = np.asarray(claves, dtype=np.float64) + 0.0
+    bits = valores.view(np.uint64)
+
+    negativos = (bits >> np.uint64(63)).astype(bool)
+    sin_signo = np.where(negativos, ~bits, bits | np.uint64(SIGN_BIT))
+
+    # Los NaN van a un extremo; entre ellos conservan el orden de entrada
+    sin_signo[np.isnan(valores)] = np.uint64(MASK_64 if nan_al_final else 0)
+    return sin_signo
+
+
+def radix_sort_float(claves, valores=None, nan_al_final=True):
+    """
+    Ordena flotantes (por ejemplo temperaturas) con Radix Sort base 256.
+
+    Admite negativos, es estable y coloca los NaN al final (o al inicio),
+    cosa que sorted() no garantiza. Igual que radix_sort_256, puede ordenar
+    una carga asociada en la misma pasada.
+
+    Args:
+        claves (list | np.ndarray): Valores flotantes a ordenar.
+        valores (list | np.ndarray): Carga opcional, del mismo largo que claves.
+        nan_al_final (bool): True para colocar los NaN al final, False al inicio.
+
+    Returns:
+        list | np.ndarray | tuple: Las claves ordenadas o la tupla
+        (claves_ordenadas, valores_ordenados), en el mismo tipo de contenedor.
+    """
+    if valores is not None and len(valores) != len(claves):
+        raise ValueError("claves y valores deben tener el mismo largo")
+
+    if np is not None:
+        orden = orden_lsd_uint64(claves_float_ordenables_numpy(claves, nan_al_final))
+    else:
+        # Sin NumPy: las claves enteras se ordenan con el motor en Python puro
+        orden = orden_radix_256_python([clave_float_ordenable(x, nan_al_final) for x in claves])
+
+    claves_ordenadas = aplicar_orden(claves, orden)
+    if valores is None:
+        return claves_ordenadas
+    return claves_ordenadas, aplicar_orden(valores, orden)
+
+
+def benchmark_radix_float(tamaños=(10_000_000, 100_000_000)):
+    """
+    Compara radix_sort_float con sorted() sobre lecturas de sensores simuladas
+    (temperaturas entre -20.0 y 120.0 °C).
+
+    Con 100 millones de lecturas la lista de Python ocupa varios GB; conviene
+    ejecutar ese tamaño solo en una máquina con memoria suficiente.
+
+    Args:
+        tamaños (tuple): Cantidades de lecturas a probar.
+
+    Returns:
+        list: Tuplas (n, segundos_sorted, segundos_radix).
+    """
+    resultados = []
+    for n in tamaños:
+        # Generamos las lecturas (con NumPy si está disponible, es mucho más rápido)
+        if np is not None:
+            lecturas = np.random.default_rng(0).uniform(-20.0, 120.0, n)
+            lista = lecturas.tolist()
+        else:
+            lista = [random.uniform(-20.0, 120.0) for _ in range(n)]
+            lecturas = lista
+
+        inicio = time.perf_counter()
+        esperado = sorted(lista)
+        t_sorted = time.perf_counter() - inicio
+        del lista
+
+        inicio = time.perf_counter()
+        obtenido = radix_sort_float(lecturas)
+        t_radix = time.perf_counter() - inicio
+
+        # Verificamos que ambos métodos producen el mismo resultado
+        if np is not None:
+            obtenido = obtenido.tolist()
+        assert obtenido == esperado
+        del esperado, obtenido
+
+        print(f"🌡️ {n:>12,} lecturas | sorted(): {t_sorted:6.2f} s | radix_sort_float: {t_radix:6.2f} s")
+        resultados.append((n, t_sorted, t_radix))
+    return resultados
+
+
 # ------------------------------------------
 # Función que imprime en consola el ranking de jugadores con sus puntuaciones
 # ------------------------------------------
@@ -119,16 +452,38 @@ if __name__ == "__main__":
     # Usamos Radix Sort para ordenar las puntuaciones (hacemos copia para no alterar la original)
     puntuaciones_ordenadas = radix_sort(puntuaciones.copy())
 
-    # Ordenamos los pares jugador-puntuación con base en la puntuación (usamos sorted + lambda)
-    jugadores_ordenados = sorted(ranking_jugadores.items(), key=lambda x: x[1])
-
-    # Invertimos la lista para que esté en orden de mayor a menor
-    jugadores_ordenados.reverse()
-
-    # Extraemos nuevamente los nombres y puntuaciones, ya ordenados
-    nombres_finales = [jugador[0] for jugador in jugadores_ordenados]
-    puntos_finales = [jugador[1] for jugador in jugadores_ordenados]
+    # Con el motor base 256 los nombres viajan como carga junto a las puntuaciones.
+    # Negamos las claves para obtener orden de mayor a menor sin perder estabilidad
+    claves, nombres_finales = radix_sort_256([-p for p in puntuaciones], nombres)
+    puntos_finales = [-c for c in claves]
 
     # Mostramos el ranking final, ya ordenado correctamente
     print("✅ Ranking final ordenado:")
     mostrar_ranking(nombres_finales, puntos_finales)
+
+    # Prueba de rendimiento: millones de puntuaciones con su id de jugador
+    if np is not None:
+        n = 10_000_000
+        rng = np.random.default_rng(42)
+        puntos = rng.integers(-1_000_000, 1_000_000, size=n, dtype=np.int64)
+        ids = np.arange(n, dtype=np.int64)
+
+        inicio = time.perf_counter()
+        puntos_ordenados, ids_ordenados = radix_sort_256(puntos, ids)
+        segundos = time.perf_counter() - inicio
+
+        # Comprobamos contra el ordenamiento estable de NumPy
+        assert np.array_equal(ids_ordenados, np.argsort(puntos, kind="stable"))
+        print(f"⚡ {n:,} puntuaciones ordenadas con su carga en {segundos:.2f} s")
+
+    # Temperaturas de sensores con negativos y una lectura fallida (NaN)
+    temperaturas = [23.5, -4.25, 101.0, float("nan"), -18.0, 0.0, 87.75, -0.0]
+    sensores = [f"S{i}" for i in range(len(temperaturas))]
+    temps_ordenadas, sensores_ordenados = radix_sort_float(temperaturas, sensores)
+    print("\n🌡️ Sensores ordenados por temperatura (NaN al final):")
+    for sensor, temp in zip(sensores_ordenados, temps_ordenadas):
+        print(f"   {sensor}: {temp} °C")
+
+    # Comparativa contra sorted(); benchmark_radix_float() sin argumentos usa 10M y 100M
+    print()
+    benchmark_radix_float((1_000_000,))
@@ -5,6 +5,25 @@
 from random import uniform  
 # Importamos la función 'uniform' del módulo 'random' para generar números decimales aleatorios en un rango dado.
 
+import os
+import importlib.util
+from functools import lru_cache
+# os e importlib permiten cargar el Radix Sort para flotantes desde "13-Radix Sort.py"
+# (el nombre del archivo tiene espacios, así que no se puede usar un import normal).
+
+@lru_cache(maxsize=None)
+def load_float_radix():
+    """
+    Carga la función radix_sort_float del script 13-Radix Sort.py,
+    que está en la misma carpeta que este archivo. El script se ejecuta
+    una sola vez: las llamadas siguientes reutilizan la función cargada.
+    """
+    ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "13-Radix Sort.py")
+    spec = importlib.util.spec_from_file_location("radix_sort_13", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo.radix_sort_float
+
 def generar_datos_sensores(num_sensores):
     """
     Genera una lista de sensores con IDs y temperaturas simuladas.
@@ -29,15 +48,24 @@ def generar_datos_sensores(num_sensores):
     return sensores  
     # Devolvemos la lista completa de sensores con sus temperaturas.
 
-def detectar_anomalias(sensores, umbral_temp=100.0):
+def detectar_anomalias(sensores, umbral_temp=100.0, metodo="timsort"):
     """
     Detecta sensores cuya temperatura supera un umbral (posible fallo o sobrecalentamiento).
     Primero ordena los sensores por temperatura (de menor a mayor) usando TimSort,
     que es el algoritmo nativo de Python en sorted().
+    Con metodo="radix" se ordena con el Radix Sort para flotantes de 13-Radix Sort.py,
+    más rápido con millones de lecturas y que deja las lecturas NaN al final.
     """
-    # Ordenamos usando sorted() (que internamente usa TimSort), especificando que
-    # la clave para ordenar es la temperatura, que está en la posición 1 de cada tupla.
-    sensores_ordenados = sorted(sensores, key=lambda x: x[1])
+    if metodo == "radix":
+        # Las temperaturas son las claves y las tuplas completas viajan como carga.
+        radix_sort_float = load_float_radix()
+        _, sensores_ordenados = radix_sort_float([s[1] for s in sensores], sensores)
+    elif metodo == "timsort":
+        # Ordenamos usando sorted() (que internamente usa TimSort), especificando que
+        # la clave para ordenar es la temperatura, que está en la posición 1 de cada tupla.
+        sensores_ordenados = sorted(sensores, key=lambda x: x[1])
+    else:
+        raise ValueError(f"Método desconocido: {metodo!r} (use 'timsort' o 'radix')")
 
     # Creamos una lista con solo los sensores cuya temperatura es mayor que el umbral.
     anomalias = [sensor for sensor in sensores_ordenados if sensor[1] > umbral_temp]
@@ -91,4 +119,9 @@ if __name__ == "__main__":
 
     mostrar_anomalias(sensores_anomalias)  
     # Imprimimos la lista (si existe) de sensores con temperaturas anómalas.
-    
\ No newline at end of file
+    
+    sensores_radix, _ = detectar_anomalias(sensores, metodo="radix")
+    # Repetimos el ordenamiento con Radix Sort para flotantes; al ser estable,
+    # el resultado debe coincidir exactamente con el de TimSort.
+
+    print("\n🔁 Radix Sort coincide con TimSort:", sensores_radix == sensores_ordenados)
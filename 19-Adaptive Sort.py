@@ -0,0 +1,240 @@
+"""
+Adaptive Sort - Despachador que elige el mejor algoritmo del repositorio
+
+Cada script del repositorio implementa un algoritmo con su propia firma
+(counting_sort(arr, key), radix_sort_256(claves, valores), natural_merge_sort(lista)...).
+Este módulo ofrece un único punto de entrada sort(data, key=None, reverse=False)
+que sondea la entrada de forma barata (tamaño, tipo de clave y rango de claves)
+y la envía al motor más adecuado:
+
+    - radix   -> enteros de más de un dígito de CPython, sin key (13-Radix Sort.py)
+    - timsort -> todo lo demás (sorted() de Python)
+
+Solo se elige un motor donde se midió que gana a sorted(). Mejor de 3-5
+repeticiones con CPython 3.11 y NumPy 2.4, en segundos (sorted / motor):
+
+    n = 1M, enteros en [0, n]             counting 0.36 / 1.17   radix 0.36 / 0.41
+    n = 1M, enteros en [0, 255]           counting 0.15 / 0.31   radix 0.15 / 0.24
+    n = 1M, casi ordenada (3 fuera)       natural_merge 0.035 / 0.75
+    n = 100k, casi ordenada               natural_merge 0.002 / 0.047
+    enteros en [0, 2**31], sin key        radix: 0.97x con n = 1000, 1.18x con 2000,
+                                          1.41x con 5000, 1.32x con 1M
+    enteros en [-2**62, 2**62], sin key   radix: 1.06x con n = 2000, 1.25x con 5000,
+                                          1.15x con 1M
+    enteros en [-2**62, 2**62], con key   radix: 1.15x con 5000, 0.97x con 100k,
+                                          0.88x con 1M
+
+counting_sort y natural_merge_sort no ganan a sorted() en ningún caso: el
+TimSort de CPython ya aprovecha las runs en C y compara enteros de un dígito
+(|x| < 2**30) por una vía rápida. Radix solo compensa cuando alguna clave
+necesita varios dígitos, y con key el coste de mover la carga en Python se
+come la ventaja con entradas grandes.
+
+Cada decisión se registra con el módulo logging para poder auditarla.
+"""
+
+import os
+import time
+import logging
+import importlib.util
+
+# Logger con nombre fijo: al ejecutarse como script __name__ sería "__main__"
+logger = logging.getLogger("adaptive_sort")
+
+# Por debajo de este tamaño sorted() gana o empata siempre (ver tabla de arriba)
+RADIX_MIN_INPUT = 5_000
+
+# Enteros de un solo dígito de CPython: sorted() los compara por la vía rápida
+SINGLE_DIGIT_LIMIT = 1 << 30
+
+# Límites de int64: fuera de ellos radix_sort_256 recurre a Python puro
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# Motores disponibles: nombre -> (archivo del repositorio, función a usar)
+ENGINE_SOURCES = {
+    "radix": ("13-Radix Sort.py", "radix_sort_256"),
+}
+
+# Caché de módulos ya cargados (o del error al cargarlos)
+_loaded_engines = {}
+
+
+# --- FUNCIÓN 1: Cargar un motor desde su script ---
+def load_engine(name):
+    """
+    Carga perezosamente la función de ordenamiento de un script del repositorio.
+
+    Los nombres de archivo llevan espacios y prefijos numéricos, así que no se
+    pueden importar con import normal; se cargan con importlib desde la misma
+    carpeta que este archivo.
+
+    Args:
+        name (str): Nombre del motor en ENGINE_SOURCES.
+
+    Returns:
+        callable | None: La función de ordenamiento, o None si el script no se
+        pudo cargar.
+    """
+    if name in _loaded_engines:
+        return _loaded_engines[name]
+
+    filename, func_name = ENGINE_SOURCES[name]
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    try:
+        spec = importlib.util.spec_from_file_location(f"adaptive_{name}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        func = getattr(module, func_name)
+    except (ImportError, OSError, AttributeError) as e:
+        logger.warning("motor %s no disponible (%s): se usará timsort", name, e)
+        func = None
+
+    _loaded_engines[name] = func
+    return func
+
+
+# --- FUNCIÓN 2: Sondear la entrada ---
+def probe(keys):
+    """
+    Perfil barato de las claves: una pasada para tipos y, con enteros, su rango.
+
+    Args:
+        keys (list): Claves ya extraídas, en el orden en que se ordenarán.
+
+    Returns:
+        dict: n, kind ('int', 'float', 'str' o 'mixed') y, solo con enteros,
+        min y max.
+    """
+    n = len(keys)
+    profile = {"n": n, "kind": "mixed", "min": None, "max": None}
+    if n == 0:
+        return profile
+
+    # Tipo de clave: bool es subclase de int, pero no se trata como entero
+    types = {type(k) for k in keys}
+    if types <= {int}:
+        profile["kind"] = "int"
+        profile["min"], profile["max"] = min(keys), max(keys)
+    elif types <= {int, float}:
+        profile["kind"] = "float"
+    elif types == {str}:
+        profile["kind"] = "str"
+    return profile
+
+
+# --- FUNCIÓN 3: Elegir motor a partir del perfil ---
+def choose_engine(profile, keyed=False):
+    """
+    Decide el motor de ordenamiento según el perfil devuelto por probe().
+
+    Args:
+        profile (dict): Perfil de la entrada.
+        keyed (bool): True si las claves salen de una función key.
+
+    Returns:
+        tuple: (motor, motivo) con motor 'radix' o 'timsort'.
+    """
+    n, kind = profile["n"], profile["kind"]
+
+    if n < RADIX_MIN_INPUT:
+        return "timsort", f"entrada pequeña (n < {RADIX_MIN_INPUT})"
+    if kind != "int":
+        return "timsort", f"claves de tipo {kind}"
+    if keyed:
+        return "timsort", "enteros con key (mover la carga cuesta más que comparar)"
+    low, high = profile["min"], profile["max"]
+    if low < INT64_MIN or high > INT64_MAX:
+        return "timsort", "enteros fuera de int64"
+    if -SINGLE_DIGIT_LIMIT < low and high < SINGLE_DIGIT_LIMIT:
+        return "timsort", "enteros de un dígito (comparación rápida de sorted())"
+    return "radix", f"enteros de varios dígitos en [{low}, {high}]"
+
+
+# --- FUNCIÓN 4: Adaptadores de cada motor a una firma común ---
+def _run_radix(func, seq, keys, key):
+    # Solo se elige sin key (ver choose_engine): las claves son los elementos
+    return func(keys)
+
+
+ENGINE_RUNNERS = {
+    "radix": _run_radix,
+}
+
+
+# --- FUNCIÓN 5: Punto de entrada único ---
+def sort(data, key=None, reverse=False):
+    """
+    Ordena data eligiendo automáticamente el algoritmo más adecuado.
+
+    Se comporta como sorted(): devuelve una lista nueva, es estable y admite
+    key y reverse. Para reverse se ordena ascendentemente la secuencia invertida
+    y se invierte el resultado, lo que mantiene el orden relativo de los
+    elementos iguales igual que sorted(reverse=True).
+
+    Args:
+        data (iterable): Elementos a ordenar.
+        key (callable): Función que extrae la clave de cada elemento.
+        reverse (bool): True para orden descendente.
+
+    Returns:
+        list: Lista ordenada.
+    """
+    seq = list(data)
+    if reverse:
+        seq.reverse()
+    keys = seq if key is None else [key(x) for x in seq]
+
+    profile = probe(keys)
+    engine, reason = choose_engine(profile, keyed=key is not None)
+
+    # Si el script del motor no carga, caemos a timsort (ya queda registrado)
+    func = load_engine(engine) if engine != "timsort" else None
+    if func is None and engine != "timsort":
+        engine, reason = "timsort", f"{engine} no disponible; {reason}"
+
+    logger.info("sort: n=%d tipo=%s -> %s (%s)",
+                profile["n"], profile["kind"], engine, reason)
+
+    start = time.perf_counter()
+    if engine == "timsort":
+        result = sorted(seq, key=key)
+    else:
+        result = ENGINE_RUNNERS[engine](func, seq, keys, key)
+    logger.debug("sort: %s terminó en %.4f s", engine, time.perf_counter() - start)
+
+    if reverse:
+        result.reverse()
+    return result
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    import random
+
+    # Mostramos en consola cada decisión del despachador
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    n = 10_000
+    casos = {
+        "enteros de rango estrecho": [random.randint(0, 5_000) for _ in range(n)],
+        "enteros de rango amplio": [random.randint(-10**9, 10**9) for _ in range(n)],
+        "enteros de 64 bits": [random.randint(-2**62, 2**62) for _ in range(n)],
+        "casi ordenada": sorted(random.randint(0, 10**6) for _ in range(n))
+                         + [random.randint(0, 10**6) for _ in range(3)],
+        "flotantes": [random.uniform(-1, 1) for _ in range(n)],
+        "cadenas": [f"user{random.randint(0, 10**6)}" for _ in range(n)],
+        "pequeña": [random.randint(0, 100) for _ in range(20)],
+    }
+
+    for nombre, datos in casos.items():
+        print(f"\n📦 Caso: {nombre}")
+        assert sort(datos) == sorted(datos)
+        assert sort(datos, reverse=True) == sorted(datos, reverse=True)
+        print("✅ Resultado idéntico a sorted()")
+
+    # Ordenar registros por una clave, de mayor a menor
+    pedidos = [(random.randint(1, 500), f"pedido-{i}") for i in range(1_000)]
+    por_importe = sort(pedidos, key=lambda p: p[0], reverse=True)
+    assert por_importe == sorted(pedidos, key=lambda p: p[0], reverse=True)
+    print("\n🧾 Top 3 pedidos por importe:", por_importe[:3])
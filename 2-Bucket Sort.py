@@ -1,7 +1,28 @@
 # Importamos el módulo math para usar la función floor()
 import math
+# os e importlib para cargar el Radix Sort de flotantes desde "13-Radix Sort.py"
+import os
+import importlib.util
+from functools import lru_cache
 
-def bucket_sort(arr, bucket_size=10):
+
+@lru_cache(maxsize=None)
+def load_float_radix():
+    """
+    Carga radix_sort_float desde el script 13-Radix Sort.py de esta misma carpeta.
+    El script se ejecuta una sola vez; las llamadas siguientes usan la caché.
+
+    Retorna:
+        function: radix_sort_float(claves, valores=None, nan_al_final=True)
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "13-Radix Sort.py")
+    spec = importlib.util.spec_from_file_location("radix_sort_13", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.radix_sort_float
+
+
+def bucket_sort(arr, bucket_size=10, bucket_sorter="timsort"):
     """
     Implementación detallada del algoritmo Bucket Sort para ordenar números flotantes.
     
@@ -13,6 +34,9 @@ def bucket_sort(arr, bucket_size=10):
     Parámetros:
         arr (list): Lista de números flotantes a ordenar. Idealmente en el rango [0,1).
         bucket_size (int): Cantidad de cubetas a utilizar. Por defecto 10.
+        bucket_sorter (str): Algoritmo para ordenar cada cubeta: "timsort" (list.sort)
+            o "radix" (Radix Sort para flotantes IEEE-754 de 13-Radix Sort.py,
+            conveniente cuando las cubetas son grandes).
         
     Retorna:
         list: Lista ordenada de los elementos de entrada.
@@ -58,9 +82,16 @@ def bucket_sort(arr, bucket_size=10):
     
     # --- PASO 5: Ordenamiento interno de cubetas ---
     # Iteramos sobre cada cubeta para ordenar sus elementos
-    # Usamos el método sort() de Python que implementa TimSort (híbrido de MergeSort e InsertionSort)
-    for bucket in buckets:
-        bucket.sort()  # Ordenamos in-place para ahorrar memoria
+    if bucket_sorter == "radix":
+        # Radix Sort para flotantes: sin comparaciones, O(n) por cubeta
+        radix_sort_float = load_float_radix()
+        buckets = [radix_sort_float(bucket) for bucket in buckets]
+    elif bucket_sorter == "timsort":
+        # Usamos el método sort() de Python que implementa TimSort (híbrido de MergeSort e InsertionSort)
+        for bucket in buckets:
+            bucket.sort()  # Ordenamos in-place para ahorrar memoria
+    else:
+        raise ValueError(f"bucket_sorter desconocido: {bucket_sorter!r}")
     
     # --- PASO 6: Concatenación de resultados ---
     # Creamos una lista vacía para almacenar el resultado final
@@ -91,4 +122,7 @@ if __name__ == "__main__":
     
     # Mostramos el resultado ordenado
     print("Datos ordenados:", sorted_data)
-  
\ No newline at end of file
+  
+    # Mismo ordenamiento, pero cada cubeta se ordena con Radix Sort para flotantes
+    radix_data = bucket_sort(data, bucket_size=5, bucket_sorter="radix")
+    print("Con cubetas radix:", radix_data, "| coincide:", radix_data == sorted_data)
@@ -9,12 +9,19 @@ y distribución uniforme. Destaca su utilidad en preprocesamiento de datos para
 # Importación de librerías:
 # numpy para operaciones numéricas eficientes
 # defaultdict para manejo avanzado de diccionarios
+# repeat para recorrer los conteos sin crear listas
 # matplotlib.pyplot para visualizaciones
 import numpy as np
 from collections import defaultdict
+from itertools import repeat
 import matplotlib.pyplot as plt
 
-def counting_sort(arr, key=lambda x: x, visualize=False):
+# Si el rango de claves (max - min + 1) supera este múltiplo del número de
+# elementos, el modo "auto" usa el conteo disperso: un arreglo de rango
+# completo desperdiciaría memoria (una sola clave atípica como 10**12 lo agotaría)
+SPARSE_RANGE_RATIO = 4
+
+def counting_sort(arr, key=lambda x: x, visualize=False, mode="auto"):
     """
     Función principal de Counting Sort mejorada.
     
@@ -22,6 +29,9 @@ def counting_sort(arr, key=lambda x: x, visualize=False):
         arr: Lista/array de elementos a ordenar (números, strings, objetos)
         key: Función que extrae el valor clave para ordenar (por defecto el elemento mismo)
         visualize: Flag para mostrar visualización del proceso (False por defecto)
+        mode: "dense" (arreglo de conteo de max-min+1 posiciones), "sparse"
+              (diccionario con solo las claves distintas) o "auto" (elige según
+              la relación entre rango y longitud, ver SPARSE_RANGE_RATIO)
     
     Retorna:
         Lista ordenada según la clave especificada
@@ -31,6 +41,7 @@ def counting_sort(arr, key=lambda x: x, visualize=False):
         - Visualización interactiva del proceso
         - Maneja valores negativos
         - Trabaja con datos multidimensionales
+        - Modo disperso: la memoria crece con las claves distintas, no con el rango
     """
     
     # Validación de entrada: si la lista está vacía, retornar inmediatamente
@@ -45,6 +56,14 @@ def counting_sort(arr, key=lambda x: x, visualize=False):
     # Encuentra los valores mínimo y máximo para definir el rango de conteo
     min_key, max_key = min(keys), max(keys)
     
+    # Selección del modo: con un rango mucho mayor que n usamos el conteo disperso
+    if mode == "auto":
+        mode = "sparse" if max_key - min_key + 1 > SPARSE_RANGE_RATIO * len(keys) else "dense"
+    if mode == "sparse":
+        return _sparse_counting_sort(arr, keys, visualize)
+    if mode != "dense":
+        raise ValueError(f"mode debe ser 'auto', 'dense' o 'sparse', no {mode!r}")
+    
     # Creación del arreglo de conteo:
     # Tamaño calculado como (max - min + 1) para cubrir todos los valores posibles
     count_size = max_key - min_key + 1
@@ -90,6 +109,52 @@ def counting_sort(arr, key=lambda x: x, visualize=False):
     
     return output  # Retorna la lista ordenada
 
+def _sparse_counting_sort(arr, keys, visualize=False):
+    """
+    Counting Sort para dominios dispersos (rango enorme, pocas claves distintas).
+    
+    Parámetros:
+        arr: Lista de elementos a ordenar
+        keys: Claves ya extraídas de cada elemento (mismo orden que arr)
+        visualize: Flag para mostrar el conteo de las claves distintas
+    
+    Retorna:
+        Lista ordenada (estable) según las claves
+    
+    Memoria O(n + d) y tiempo O(n + d log d), con d = número de claves distintas.
+    """
+    # Fase 1: Conteo en un diccionario (solo existen las claves presentes)
+    count = defaultdict(int)
+    for k in keys:
+        count[k] += 1
+    
+    # Fase 2: Ordenamos únicamente las claves distintas
+    distinct = sorted(count)
+    
+    # Visualización opcional del conteo de claves distintas
+    if visualize:
+        plt.figure(figsize=(10, 4))
+        plt.bar([str(k) for k in distinct], [count[k] for k in distinct])
+        plt.title("Conteo disperso: claves distintas")
+        plt.xlabel("Claves")
+        plt.ylabel("Conteo")
+        plt.show()
+    
+    # Fase 3: Posición inicial de cada clave (suma acumulada sobre las distintas)
+    position = {}
+    total = 0
+    for k in distinct:
+        position[k] = total
+        total += count[k]
+    
+    # Fase 4: Dispersión en orden de entrada para mantener estabilidad
+    output = [None] * len(arr)
+    for x, k in zip(arr, keys):
+        output[position[k]] = x
+        position[k] += 1
+    
+    return output
+
 def counting_sort_2d(matrix, axis=0, key=lambda x: x):
     """
     Versión extendida para matrices 2D que permite ordenar por filas o columnas.
@@ -115,58 +180,247 @@ def counting_sort_2d(matrix, axis=0, key=lambda x: x):
 
 class AdvancedCountingSort:
     """
-    Versión orientada a objetos para ordenamiento más complejo.
-    Permite separar las fases del algoritmo y reutilizar resultados.
+    Histograma de conteo "vivo" para valores enteros de rango acotado.
+
+    En lugar de construir el arreglo de conteo una sola vez, mantiene el orden
+    de un flujo de datos sin reordenar: admite inserciones y borrados, consultas
+    de rango (rank) y cuantiles, y una vista ordenada en cualquier momento.
+
+    Estructura interna:
+        - _count: conteo por clave, desplazado por min_key
+        - _tree: árbol de Fenwick (Binary Indexed Tree) sobre _count, que da
+          sumas de prefijos y búsquedas por posición en O(log k)
+        - _buckets: solo con una key personalizada, los elementos de cada clave
+          en orden de llegada (estabilidad); con key=None no existe y los
+          valores se reconstruyen desde los conteos
+
+    Costes (k = tamaño del rango de claves, b = elementos con la misma clave):
+        Memoria: O(k) con key=None; O(k + n) con key personalizada (buckets)
+        add: O(log k)   remove: O(log k) con key=None, O(log k + b) con key
+        rank / quantile: O(log k)   count: O(1)
+        sorted_view: generador perezoso, O(n + k) al recorrerlo completo
     """
     
-    def __init__(self, data, key=lambda x: x):
+    def __init__(self, data=(), key=None, min_key=None, max_key=None):
         """
-        Constructor: Inicializa el ordenador con datos y función clave.
+        Constructor: Inicializa el histograma y añade los datos iniciales.
         
         Parámetros:
-            data: Datos a ordenar
-            key: Función para extraer valores de ordenación
+            data: Datos iniciales (opcional)
+            key: Función para extraer la clave entera de cada elemento. Con
+                None (por defecto) los elementos son las propias claves y solo
+                se guardan conteos; con una función se guardan también los
+                elementos para devolverlos en sorted_view
+            min_key, max_key: Rango de claves esperado (opcional). Si no se
+                indica se deduce de los datos, y crece solo si llega una clave
+                fuera de él.
         """
-        self.data = data  # Almacena los datos originales
         self.key = key  # Función clave para ordenamiento
-        self._count = None  # Arreglo de conteo (se calcula luego)
-        self._sorted = None  # Resultado ordenado (se calcula luego)
-    
-    def build_count(self):
-        """Construye y retorna el arreglo de conteo de frecuencias."""
-        keys = [self.key(x) for x in self.data]  # Extrae claves
-        min_key, max_key = min(keys), max(keys)  # Encuentra rango
-        self._count = [0] * (max_key - min_key + 1)  # Inicializa conteo
+        self.min_key = None  # Clave correspondiente a la posición 0 de _count
+        self._count = []  # Conteo por clave
+        self._tree = [0]  # Árbol de Fenwick (índices desde 1)
+        # Clave -> elementos con esa clave, en orden de llegada (solo con key)
+        self._buckets = None if key is None else {}
+        self._total = 0  # Número total de elementos
+        
+        # Reservamos el rango indicado o el de los datos iniciales de una sola vez
+        data = list(data)
+        keys = data if key is None else [key(x) for x in data]
+        if keys:
+            min_key = min(keys) if min_key is None else min(min_key, min(keys))
+            max_key = max(keys) if max_key is None else max(max_key, max(keys))
+        if min_key is not None and max_key is not None:
+            self.min_key = min_key
+            self._count = [0] * (max_key - min_key + 1)
         
-        # Cuenta ocurrencias de cada valor clave
+        # Conteo inicial en O(n) y construcción del árbol en O(k)
         for k in keys:
-            self._count[k - min_key] += 1
+            self._count[k - self.min_key] += 1
+        if self._buckets is not None:
+            for x, k in zip(data, keys):
+                self._buckets.setdefault(k, []).append(x)
+        self._total = len(keys)
+        self._rebuild_tree()
+    
+    def __len__(self):
+        """Número de elementos en el histograma."""
+        return self._total
+    
+    @property
+    def max_key(self):
+        """Mayor clave representable sin ampliar el rango."""
+        if self.min_key is None:
+            return None
+        return self.min_key + len(self._count) - 1
+    
+    def _rebuild_tree(self):
+        """Construye el árbol de Fenwick a partir de _count en O(k)."""
+        k = len(self._count)
+        tree = [0] * (k + 1)
+        for i in range(1, k + 1):
+            tree[i] += self._count[i - 1]
+            parent = i + (i & -i)  # Nodo que también cubre la posición i
+            if parent <= k:
+                tree[parent] += tree[i]
+        self._tree = tree
+    
+    def _tree_add(self, index, delta):
+        """Suma delta al conteo de la posición index (desde 0) en el árbol."""
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+    
+    def _prefix(self, index):
+        """Cantidad de elementos en las posiciones [0, index)."""
+        total = 0
+        i = min(index, len(self._count))
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+    
+    def _ensure_range(self, k):
+        """
+        Amplía el rango para incluir la clave k, al menos duplicándolo para que
+        el coste de reconstrucción O(k) se reparta entre muchas inserciones.
+        """
+        if self.min_key is None:
+            self.min_key = k
+            self._count = [0]
+            self._rebuild_tree()
+            return
+        if self.min_key <= k <= self.max_key:
+            return
         
-        return self._count  # Retorna arreglo de conteo
+        size, max_key = len(self._count), self.max_key
+        if k < self.min_key:
+            new_size = max(2 * size, max_key - k + 1)
+            self._count = [0] * (new_size - size) + self._count
+            self.min_key = max_key - new_size + 1
+        else:
+            new_size = max(2 * size, k - self.min_key + 1)
+            self._count = self._count + [0] * (new_size - size)
+        self._rebuild_tree()
     
-    def sort(self):
-        """Ejecuta el algoritmo completo y retorna los datos ordenados."""
-        if not self._count:  # Si no se ha construido el conteo
-            self.build_count()  # Lo calcula primero
+    def add(self, x):
+        """Añade un elemento al histograma en O(log k)."""
+        k = x if self.key is None else self.key(x)
+        self._ensure_range(k)
+        self._count[k - self.min_key] += 1
+        self._tree_add(k - self.min_key, 1)
+        if self._buckets is not None:
+            self._buckets.setdefault(k, []).append(x)
+        self._total += 1
+    
+    def remove(self, x):
+        """
+        Quita una aparición del elemento x en O(log k). Con una key
+        personalizada se suma la búsqueda de x entre los b elementos con su
+        misma clave (list.remove, O(b)).
+        
+        Lanza ValueError si x no está en el histograma, igual que list.remove.
+        """
+        if self.key is None:
+            k = x
+            if not self.count(k):
+                raise ValueError(f"{x!r} no está en el histograma")
+        else:
+            k = self.key(x)
+            bucket = self._buckets.get(k)
+            if not bucket:
+                raise ValueError(f"{x!r} no está en el histograma")
+            bucket.remove(x)  # Lanza ValueError si no hay un elemento igual
+            if not bucket:
+                del self._buckets[k]
+        self._count[k - self.min_key] -= 1
+        self._tree_add(k - self.min_key, -1)
+        self._total -= 1
+    
+    def count(self, k):
+        """Número de elementos con clave exactamente k, en O(1)."""
+        if self.min_key is None or not self.min_key <= k <= self.max_key:
+            return 0
+        return self._count[k - self.min_key]
+    
+    def rank(self, k):
+        """
+        Número de elementos con clave estrictamente menor que k, en O(log k).
+        Es la posición que ocuparía k en la lista ordenada.
+        """
+        if self.min_key is None or k <= self.min_key:
+            return 0
+        return self._prefix(k - self.min_key)
+    
+    def quantile(self, q):
+        """
+        Clave del cuantil q (0 <= q <= 1), en O(log k).
         
-        # Fase de acumulación:
-        # Convierte conteos en posiciones finales
-        for i in range(1, len(self._count)):
-            self._count[i] += self._count[i-1]
+        Usa el criterio "inferior": la clave del elemento en la posición
+        floor(q * (n - 1)) de la lista ordenada, como numpy.quantile(method="lower").
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q debe estar entre 0 y 1")
+        if self._total == 0:
+            raise ValueError("el histograma está vacío")
         
-        # Fase de construcción del resultado:
-        output = [None] * len(self.data)  # Prepara lista de salida
+        # Descenso por el árbol de Fenwick: buscamos la primera posición cuya
+        # suma de prefijos supere target, bajando de la potencia de 2 mayor
+        target = int(q * (self._total - 1))
+        pos = 0
+        step = 1 << (len(self._count).bit_length() - 1)
+        while step:
+            nxt = pos + step
+            if nxt <= len(self._count) and self._tree[nxt] <= target:
+                pos = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return pos + self.min_key
+    
+    def sorted_view(self):
+        """Generador perezoso con los elementos en orden (estable)."""
+        if self.min_key is None:
+            return
+        for offset, c in enumerate(self._count):
+            if not c:
+                continue
+            if self._buckets is None:
+                # Sin buckets, cada clave se repite tantas veces como su conteo
+                yield from repeat(self.min_key + offset, c)
+            else:
+                yield from self._buckets[self.min_key + offset]
+    
+    def merge(self, other):
+        """
+        Incorpora los elementos de otro histograma (in situ) y retorna self.
         
-        # Procesa elementos en orden inverso para mantener estabilidad
-        for x in reversed(self.data):
-            k = self.key(x)  # Obtiene clave del elemento
-            # Calcula posición y coloca el elemento
-            output[self._count[k - min(self._count)] - 1] = x
-            # Decrementa el contador para esa clave
-            self._count[k - min(self._count)] -= 1
+        El rango se amplía para cubrir ambos y el árbol se reconstruye una sola
+        vez, en O(k) en lugar de O(n log k) insertando uno por uno.
+        """
+        if (self._buckets is None) != (other._buckets is None):
+            raise ValueError("no se puede fusionar un histograma con key y otro sin key")
+        if other.min_key is None:
+            return self
+        self._ensure_range(other.min_key)
+        self._ensure_range(other.max_key)
         
-        self._sorted = output  # Almacena resultado
-        return self._sorted  # Retorna datos ordenados
+        offset = other.min_key - self.min_key
+        for i, c in enumerate(other._count):
+            self._count[offset + i] += c
+        if self._buckets is not None:
+            for k, items in other._buckets.items():
+                self._buckets.setdefault(k, []).extend(items)
+        self._total += other._total
+        self._rebuild_tree()
+        return self
+    
+    def build_count(self):
+        """Retorna una copia del arreglo de conteo (posición 0 = min_key)."""
+        return list(self._count)
+    
+    def sort(self):
+        """Retorna los datos ordenados como lista."""
+        return list(self.sorted_view())
 
 # Bloque principal de ejecución (solo se ejecuta al llamar directamente al script)
 if __name__ == "__main__":
@@ -189,6 +443,12 @@ if __name__ == "__main__":
     ordenado_edad = counting_sort(personas, key=lambda x: x['edad'])
     print("Ordenado por edad:", ordenado_edad)
     
+    # Ejemplo 2b: Una clave atípica enorme activa el modo disperso automáticamente
+    print("\n=== EJEMPLO 2b: Dominio disperso ===")
+    ids = [7, 10**12, 3, 7, -5, 10**12]  # Rango de ~10^12 con solo 4 claves distintas
+    print("Original:", ids)
+    print("Ordenado (modo disperso):", counting_sort(ids))
+    
     # Ejemplo 3: Ordenamiento de matriz 2D por columnas
     print("\n=== EJEMPLO 3: Ordenamiento de matriz 2D ===")
     matriz = [  # Matriz de prueba 3x3
@@ -211,6 +471,18 @@ if __name__ == "__main__":
     sorter = AdvancedCountingSort(datos)  # Crea instancia con datos
     print("Conteo:", sorter.build_count())  # Construye y muestra conteo
     print("Resultado ordenado:", sorter.sort())  # Ordena y muestra resultado
+    
+    # El histograma sigue vivo: insertamos y borramos sin reordenar
+    sorter.add(5)
+    sorter.add(0)
+    sorter.remove(8)
+    print("Tras add(5), add(0), remove(8):", list(sorter.sorted_view()))
+    print("Elementos menores que 3:", sorter.rank(3))  # Consulta de rango
+    print("Mediana:", sorter.quantile(0.5))  # Cuantil 50%
+    
+    # Fusión de dos histogramas (p. ej. de dos flujos distintos)
+    otro = AdvancedCountingSort([7, 9, 1])
+    print("Fusionado:", sorter.merge(otro).sort())
 
     # Aplicación práctica en IA: Normalización de características
     print("\n=== APLICACIÓN EN IA: Normalización de características ===")